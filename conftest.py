@@ -0,0 +1,114 @@
+"""
+Shared pytest fixtures for the Tongyi Agent test suite.
+
+Expensive objects (tool registry, orchestrators, agents) are built once per
+session and reused by the root-level verification scripts and ``tests/``.
+"""
+import importlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Make the flat src/ modules importable once for every test module
+_SRC = Path(__file__).resolve().parent / "src"
+sys.path.insert(0, str(_SRC))
+
+# Heavy modules imported up front so tests hit the sys.modules fast path
+# instead of paying import cost mid-test
+_WARM_MODULES = (
+    "tool_registry",
+    "pdf_tools",
+    "delegation_policy",
+    "verifier_gate",
+    "orchestrator_local",
+    "tongyi_orchestrator",
+    "claude_agent_orchestrator",
+    "optimized_tongyi_agent",
+    "optimized_claude_agent",
+    "training_manager",
+)
+
+
+def pytest_sessionstart(session):
+    for name in _WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+@pytest.fixture(scope="session")
+def tool_registry():
+    """ToolRegistry rooted at the repository, shared across the session."""
+    from tool_registry import ToolRegistry
+
+    return ToolRegistry(root=".")
+
+
+@pytest.fixture(scope="session")
+def tools(tool_registry):
+    """Tool schemas exposed by the shared registry."""
+    return tool_registry.get_tools()
+
+
+@pytest.fixture(scope="session")
+def tools_by_name(tools):
+    """Mapping of tool name to tool schema for O(1) lookups."""
+    return {t.name: t for t in tools}
+
+
+@pytest.fixture(scope="session")
+def schemas(tools):
+    """Mapping of tool name to its JSON parameter schema."""
+    return {t.name: t.parameters for t in tools}
+
+
+@pytest.fixture(scope="session")
+def openrouter_key():
+    """OpenRouter API key read once per session; skips when unset."""
+    key = os.environ.get("OPENROUTER_API_KEY")
+    if not key:
+        pytest.skip("OPENROUTER_API_KEY not set")
+    return key
+
+
+@pytest.fixture(scope="session")
+def claude_orchestrator():
+    """ClaudeAgentOrchestrator, skipped when the Claude Code SDK is missing."""
+    pytest.importorskip("claude_code_sdk")
+    from claude_agent_orchestrator import ClaudeAgentOrchestrator
+
+    return ClaudeAgentOrchestrator(root=".")
+
+
+@pytest.fixture(scope="session")
+def tongyi_agent():
+    """OptimizedTongyiAgent with training disabled."""
+    from optimized_tongyi_agent import OptimizedTongyiAgent
+
+    return OptimizedTongyiAgent(enable_training=False)
+
+
+@pytest.fixture(scope="session", params=["tongyi", "claude"])
+def agent(request):
+    """Each optimized agent type, built once per session."""
+    if request.param == "tongyi":
+        return request.getfixturevalue("tongyi_agent")
+    pytest.importorskip("claude_code_sdk")
+    from optimized_claude_agent import OptimizedClaudeAgent
+
+    return OptimizedClaudeAgent(enable_training=False)
+
+
+@pytest.fixture(scope="session")
+def process_pool():
+    """Single-worker process pool for tests marked ``isolated``.
+
+    Work submitted here runs with its own interpreter state and event loop,
+    so SDK sessions cannot leak into other tests.
+    """
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        yield pool
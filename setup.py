@@ -35,9 +35,12 @@ setup(
     install_requires=requirements,
     extras_require={
         "claude-sdk": ["claude-code-sdk"],
+        "fast-json": ["orjson>=3.9"],
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.26.0",
+            "pytest-timeout>=2.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
@@ -9,15 +9,61 @@ import logging
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Iterator, Callable
+from typing import Any, Dict, Iterable, List, Optional, Iterator, Callable, Tuple
 
 from cas_store import CAS
 from verifier_gate import VerifierGate
 
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` the way orjson does: compact separators, raw UTF-8."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Optional faster JSON codec; orjson.JSONDecodeError subclasses json's, so
+# callers keep catching json.JSONDecodeError either way. The two encoders are
+# equivalent for plain JSON data, so CAS keys for it don't depend on which
+# one is installed
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    _dumps = _json_dumps
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Read size for the JSONL splitter
+_JSONL_CHUNK_SIZE = 64 * 1024
+
+
+
+def _iter_jsonl_lines(file_path: Path) -> Iterator[bytes]:
+    """Yield the raw lines of a JSONL file, reading it in fixed-size chunks.
+
+    Splitting the byte buffer on ``\\n`` directly avoids per-line text decoding;
+    the JSON decoder accepts the UTF-8 bytes as-is.
+    """
+    buf = bytearray()
+    with open(file_path, "rb") as f:
+        while True:
+            chunk = f.read(_JSONL_CHUNK_SIZE)
+            if chunk:
+                buf += chunk
+            start = 0
+            while (nl := buf.find(b"\n", start)) != -1:
+                yield bytes(buf[start:nl])
+                start = nl + 1
+            del buf[:start]
+            if not chunk:
+                break
+    if buf:
+        yield bytes(buf)
+
+
+@dataclass(slots=True)
 class DataItem:
     """Single data item with metadata and quality metrics."""
     content: str
@@ -38,6 +84,7 @@ class IterationConfig:
     verification_enabled: bool = True
     compression_ratio: float = 0.3
     cache_results: bool = True
+    verify_cache: bool = False  # reuse verdicts for unchanged (content, sources)
     seed: int = 1337
 
 
@@ -56,12 +103,14 @@ class DataIterator:
         self.cas = cas_store or CAS()
         self.verifier = verifier or VerifierGate()
         self.iteration_history: List[Dict[str, Any]] = []
+        self._verify_memo: Dict[Tuple[str, Tuple[str, ...]], str] = {}
         
     def iterate_dataset(
         self,
-        dataset_path: str,
-        transform_fn: Callable[[DataItem], DataItem],
-        quality_fn: Callable[[DataItem], float]
+        dataset_path: Optional[str] = None,
+        transform_fn: Optional[Callable[[DataItem], DataItem]] = None,
+        quality_fn: Optional[Callable[[DataItem], float]] = None,
+        dataset_source: Optional[Iterable[Dict[str, Any]]] = None,
     ) -> Iterator[DataItem]:
         """
         Iterate through a dataset, applying transformations and quality improvements.
@@ -70,18 +119,28 @@ class DataIterator:
             dataset_path: Path to input dataset (JSONL, CSV, etc.)
             transform_fn: Function to transform/analyze data items
             quality_fn: Function to score data quality
+            dataset_source: Already-parsed records to use instead of reading
+                ``dataset_path``; each record is handled like a JSONL line
             
         Yields:
             DataItem: Improved data items
         """
-        dataset_file = self.root / dataset_path
-        if not dataset_file.exists():
-            raise FileNotFoundError(f"Dataset not found: {dataset_path}")
+        if transform_fn is None or quality_fn is None:
+            raise TypeError("iterate_dataset() requires transform_fn and quality_fn")
+        if dataset_source is not None:
+            logger.info("Starting data iteration for in-memory source")
+            raw_items = [self._record_to_item(record) for record in dataset_source]
+        else:
+            if dataset_path is None:
+                raise ValueError("Either dataset_path or dataset_source is required")
+            dataset_file = self.root / dataset_path
+            if not dataset_file.exists():
+                raise FileNotFoundError(f"Dataset not found: {dataset_path}")
+                
+            logger.info(f"Starting data iteration for {dataset_path}")
             
-        logger.info(f"Starting data iteration for {dataset_path}")
-        
-        # Load initial dataset
-        raw_items = self._load_dataset(dataset_file)
+            # Load initial dataset
+            raw_items = self._load_dataset(dataset_file)
         logger.info(f"Loaded {len(raw_items)} items from dataset")
         
         # Process in batches
@@ -102,21 +161,24 @@ class DataIterator:
         else:
             raise ValueError(f"Unsupported format: {suffix}")
     
+    @staticmethod
+    def _record_to_item(data: Dict[str, Any]) -> DataItem:
+        """Build a DataItem from one parsed JSON record."""
+        return DataItem(
+            content=data.get('content', str(data)),
+            metadata=data.get('metadata', {}),
+            sources=data.get('sources', [])
+        )
+    
     def _load_jsonl(self, file_path: Path) -> List[DataItem]:
         """Load JSONL dataset."""
         items = []
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                try:
-                    data = json.loads(line.strip())
-                    item = DataItem(
-                        content=data.get('content', str(data)),
-                        metadata=data.get('metadata', {}),
-                        sources=data.get('sources', [])
-                    )
-                    items.append(item)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON at line {line_num}: {e}")
+        for line_num, line in enumerate(_iter_jsonl_lines(file_path), 1):
+            try:
+                data = _loads(line)
+                items.append(self._record_to_item(data))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid JSON at line {line_num}: {e}")
         return items
     
     def _load_json(self, file_path: Path) -> List[DataItem]:
@@ -125,20 +187,9 @@ class DataIterator:
             data = json.load(f)
         
         if isinstance(data, list):
-            return [
-                DataItem(
-                    content=item.get('content', str(item)),
-                    metadata=item.get('metadata', {}),
-                    sources=item.get('sources', [])
-                )
-                for item in data
-            ]
+            return [self._record_to_item(item) for item in data]
         else:
-            return [DataItem(
-                content=data.get('content', str(data)),
-                metadata=data.get('metadata', {}),
-                sources=data.get('sources', [])
-            )]
+            return [self._record_to_item(data)]
     
     def _load_csv(self, file_path: Path) -> List[DataItem]:
         """Load CSV dataset."""
@@ -171,7 +222,7 @@ class DataIterator:
             logger.info(f"Processing iteration {iteration + 1}/{self.config.max_iterations}")
             iteration_start = time.time()
             
-            improved_batch = []
+            scored_batch = []
             for item in current_batch:
                 try:
                     # Apply transformation
@@ -179,29 +230,30 @@ class DataIterator:
                     improved_item.iteration = iteration + 1
                     
                     # Score quality
-                    quality_score = quality_fn(improved_item)
-                    improved_item.quality_score = quality_score
-                    
-                    # Verify if enabled
-                    if self.config.verification_enabled:
-                        verification_result = self._verify_item(improved_item)
-                        improved_item.verification_status = verification_result
-                    
-                    # Cache if enabled
-                    if self.config.cache_results:
-                        self._cache_item(improved_item)
-                    
-                    improved_batch.append(improved_item)
-                    
-                    # Yield if meets quality threshold
-                    if quality_score >= self.config.quality_threshold:
-                        yield improved_item
+                    improved_item.quality_score = quality_fn(improved_item)
+                    scored_batch.append(improved_item)
                         
                 except Exception as e:
                     logger.error(f"Error processing item: {e}")
                     # Yield original item as fallback
                     yield item
             
+            # Verify if enabled, once for the whole batch
+            if self.config.verification_enabled:
+                self._verify_items(scored_batch)
+            
+            improved_batch = []
+            for improved_item in scored_batch:
+                # Cache if enabled
+                if self.config.cache_results:
+                    self._cache_item(improved_item)
+                
+                improved_batch.append(improved_item)
+                
+                # Yield if meets quality threshold
+                if improved_item.quality_score >= self.config.quality_threshold:
+                    yield improved_item
+            
             # Update batch for next iteration
             current_batch = improved_batch
             
@@ -222,22 +274,43 @@ class DataIterator:
             
             logger.info(f"Iteration {iteration + 1} completed in {iteration_time:.2f}s, avg quality: {avg_quality:.3f}")
     
-    def _verify_item(self, item: DataItem) -> str:
-        """Verify a data item using the verifier gate."""
-        try:
-            # Extract claims from content (simplified)
-            claims = [item.content]  # In practice, would extract individual claims
-            
-            # Verify against sources
-            if item.sources:
-                claim = self.verifier.verify_claim(item.content, item.sources)
-                return "verified" if claim.verified else "failed"
+    def _verify_items(self, items: List[DataItem]) -> None:
+        """Verify a batch of data items with a single verifier gate call."""
+        # Extract claims from content (simplified); in practice, would
+        # extract individual claims
+        memo = self._verify_memo if self.config.verify_cache else None
+        sourced = []
+        for item in items:
+            if not item.sources:
+                item.verification_status = "pending"  # No sources to verify against
+            elif memo is not None and (item.content, tuple(item.sources)) in memo:
+                item.verification_status = memo[item.content, tuple(item.sources)]
             else:
-                return "pending"  # No sources to verify against
-                
-        except Exception as e:
-            logger.warning(f"Verification failed: {e}")
-            return "failed"
+                sourced.append(item)
+        if not sourced:
+            return
+        
+        # Verify against sources, one verifier call for the whole batch when
+        # the gate supports it
+        claims = None
+        verify_batch = getattr(self.verifier, "verify_batch", None)
+        if verify_batch is not None:
+            try:
+                claims = verify_batch([(item.content, item.sources) for item in sourced])
+            except Exception as e:
+                logger.warning(f"Batch verification failed, verifying items individually: {e}")
+        
+        for i, item in enumerate(sourced):
+            try:
+                claim = claims[i] if claims is not None else self.verifier.verify_claim(item.content, item.sources)
+            except Exception as e:
+                # One bad claim must not fail the rest of the batch
+                logger.warning(f"Verification failed: {e}")
+                item.verification_status = "failed"
+                continue
+            item.verification_status = "verified" if claim.verified else "failed"
+            if memo is not None:
+                memo[item.content, tuple(item.sources)] = item.verification_status
     
     def _cache_item(self, item: DataItem) -> None:
         """Cache an item in CAS."""
@@ -248,8 +321,14 @@ class DataIterator:
                 "quality_score": item.quality_score,
                 "iteration": item.iteration,
             }
+            try:
+                payload = _dumps(item_data)
+            except TypeError:
+                # orjson rejects some data the stdlib still encodes, such as
+                # ints wider than 64 bits or non-str keys
+                payload = _json_dumps(item_data)
             cas_key = self.cas.put(
-                json.dumps(item_data).encode("utf-8"),
+                payload,
                 url=None,
                 fetched_at=None,
                 content_type="application/json",
@@ -84,6 +84,13 @@ class DelegationPolicy:
         self._inc_metric("calls.total")
         return compressed
 
+    def deplete(self, agent_id: str, n: int = 1) -> None:
+        """Mark ``n`` calls as used for ``agent_id`` without recording output."""
+        budget = self.agent_budgets.get(agent_id)
+        if not budget:
+            raise ValueError(f"unknown agent_id {agent_id}")
+        budget.calls_used += n
+
     def remaining(self, agent_id: str) -> tuple[int, int]:
         budget = self.agent_budgets.get(agent_id)
         if not budget:
@@ -0,0 +1,33 @@
+"""Path checks shared by the optimized agents' training-data exports."""
+from __future__ import annotations
+
+import re
+
+# Path fragments an export target may not contain, matched case-insensitively
+DANGEROUS_PATH_RE = re.compile("|".join(map(re.escape, (
+    "..\\",
+    "../",
+    "C:\\Windows\\System32",  # This will also match subdirectories
+    "/etc/",                  # This will also match subdirectories
+    "/var/",
+    "/root/",
+))), re.IGNORECASE)
+
+# Specific system files an export may never overwrite
+DANGEROUS_FILE_RE = re.compile("|".join(map(re.escape, (
+    "\\etc\\passwd",
+    "\\etc\\shadow",
+    "\\etc\\hosts",
+    "\\windows\\system32\\config",
+    "\\windows\\system32\\drivers\\etc\\hosts",
+    "\\windows\\system32\\sam",
+    "\\windows\\system32\\security",
+))), re.IGNORECASE)
+
+
+def check_export_path(filepath: str) -> None:
+    """Raise ValueError if ``filepath`` points somewhere exports must not go."""
+    if DANGEROUS_PATH_RE.search(filepath):
+        raise ValueError("Dangerous path pattern detected")
+    if DANGEROUS_FILE_RE.search(filepath):
+        raise ValueError("Dangerous system file access detected")
@@ -28,6 +28,7 @@ except ImportError:
 
 from tongyi_orchestrator import TongyiOrchestrator
 from config import DEFAULT_TONGYI_CONFIG
+from export_guard import check_export_path
 
 logger = logging.getLogger(__name__)
 
@@ -298,38 +299,7 @@ class OptimizedTongyiAgent:
             raise TypeError("filepath must be a string")
 
         # FIRST check for dangerous path patterns in the original input
-        dangerous_patterns = [
-            "..\\",
-            "../",
-            "..\\..\\",
-            "../../",
-            "C:\\Windows\\System32",  # This will also match subdirectories
-            "/etc/",                  # This will also match subdirectories
-            "/var/",
-            "/root/",
-            "C:\\Users\\",
-        ]
-
-        filepath_lower = filepath.lower()
-        for pattern in dangerous_patterns:
-            if pattern in filepath_lower:
-                raise ValueError("Dangerous path pattern detected")
-
-        # Additional check for specific dangerous system files
-        dangerous_files = [
-            "\\etc\\passwd",
-            "\\etc\\shadow",
-            "\\etc\\hosts",
-            "\\windows\\system32\\config",
-            "\\windows\\system32\\drivers\\etc\\hosts",
-            "\\windows\\system32\\sam",
-            "\\windows\\system32\\security"
-        ]
-
-        filepath_lower = filepath.lower()
-        for dangerous_file in dangerous_files:
-            if dangerous_file in filepath_lower:
-                raise ValueError("Dangerous system file access detected")
+        check_export_path(filepath)
 
         # Resolve relative paths safely
         if not os.path.isabs(filepath):
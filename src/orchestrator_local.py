@@ -105,9 +105,7 @@ class LocalOrchestrator:
                 for hit in hits:
                     rel = os.path.relpath(hit.path, self.root)
                     snippet = read_snippet(hit.path, start=hit.line, end=hit.line).text.replace("\n", " ").strip()
-                    if len(snippet) > 160:
-                        snippet = snippet[:157] + "…"
-                    observation_lines.append(f"{rel}:{hit.line} {snippet}")
+                    observation_lines.append(f"{rel}:{hit.line} {self._cap_snippet(snippet)}")
                 raw_observation = f"Stage {stage.name} hits: {' | '.join(observation_lines)}"
                 # Verify claims before adding to report
                 verified_observation = self._verify_and_add_claims(state, raw_observation)
@@ -172,6 +170,11 @@ class LocalOrchestrator:
                         state.last_observation = f"Delegate md_cleaner -> {response}"
                         state.report = self._compress(state.report, state.last_observation)
 
+    @staticmethod
+    def _cap_snippet(snippet: str, limit: int = 160) -> str:
+        """Cut snippets longer than ``limit`` chars, marking the cut with an ellipsis."""
+        return snippet if len(snippet) <= limit else snippet[: limit - 3] + "…"
+
     def _compress(self, report: str, addition: str, cap_tokens: int = 800) -> str:
         text = (report + "\n" + addition).strip()
         tokens = text.split()
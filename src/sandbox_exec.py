@@ -53,8 +53,14 @@ class ExecResult:
     isolated: bool = False  # True if Docker isolation was used
 
 
-def _docker_available() -> bool:
-    """Check if Docker daemon is available."""
+# Seconds a failed Docker probe is trusted before probing again
+DOCKER_RETRY_S = 30.0
+
+_docker_ok = False
+_docker_checked_at: Optional[float] = None
+
+
+def _probe_docker() -> bool:
     try:
         subprocess.run(["docker", "--version"], check=True, capture_output=True, timeout=5)
         subprocess.run(["docker", "info"], check=True, capture_output=True, timeout=5)
@@ -63,6 +69,30 @@ def _docker_available() -> bool:
         return False
 
 
+def _docker_available() -> bool:
+    """Check if Docker daemon is available.
+
+    A successful probe is cached for the life of the process. A failed one is
+    only trusted for ``DOCKER_RETRY_S`` seconds, so a daemon started later is
+    still picked up without a restart.
+    """
+    global _docker_ok, _docker_checked_at
+    if _docker_ok:
+        return True
+    now = time.monotonic()
+    if _docker_checked_at is None or now - _docker_checked_at >= DOCKER_RETRY_S:
+        _docker_ok = _probe_docker()
+        _docker_checked_at = now
+    return _docker_ok
+
+
+def _reset_docker_probe() -> None:
+    """Forget the cached Docker probe result."""
+    global _docker_ok, _docker_checked_at
+    _docker_ok = False
+    _docker_checked_at = None
+
+
 def _run_in_docker(code: str, input_json: Optional[Dict] = None, timeout_s: int = DEFAULT_TIMEOUT_S, seed: int = 1337, base_dir: Optional[str] = None) -> ExecResult:
     """Execute code inside a Docker container with resource caps and no-network."""
     harness = (
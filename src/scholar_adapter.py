@@ -34,7 +34,9 @@ import random
 import threading
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any, Dict, List, Optional, Tuple
 
 import urllib.parse
@@ -330,27 +332,52 @@ class ScholarAdapter:
         return papers
 
     # -------- Orchestration with retries/fallbacks --------
+    @staticmethod
+    def _call_provider(provider, q: str, stop: threading.Event) -> List[PaperMeta]:
+        for attempt in range(1, MAX_RETRIES + 1):
+            if stop.is_set():
+                break  # search already has enough results
+            try:
+                return provider(q)  # provider succeeded (even if empty)
+            except Exception:
+                # Backoff that ends early when search stops waiting on us
+                stop.wait(_jitter_backoff(attempt))
+        return []
+
     def search(self, query: str, k: int = 10) -> List[PaperMeta]:
         q = _norm_query(query)
         providers = [self._semantic_scholar, self._crossref, self._arxiv, self._openalex]
+        # Providers are independent HTTP fetches: fan them out, then merge in
+        # priority order so dedup still prefers the earlier provider
+        done: List[Optional[List[PaperMeta]]] = [None] * len(providers)
         results: List[PaperMeta] = []
-        seen = set()
-        for provider in providers:
-            for attempt in range(1, MAX_RETRIES + 1):
-                try:
-                    papers = provider(q)
-                    for p in papers:
-                        key = (p.title.lower(), p.year or 0)
-                        if key in seen:
-                            continue
-                        seen.add(key)
-                        results.append(p)
-                        if len(results) >= k:
-                            return results
-                    break  # provider succeeded (even if empty)
-                except Exception:
-                    time.sleep(_jitter_backoff(attempt))
-                    continue
+        seen: set[Tuple[str, int]] = set()
+        nxt = 0
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="scholar-search")
+        futs = {pool.submit(self._call_provider, provider, q, stop): i for i, provider in enumerate(providers)}
+        try:
+            for fut in as_completed(futs):
+                done[futs[fut]] = fut.result()
+                start = nxt
+                while nxt < len(providers) and done[nxt] is not None:
+                    nxt += 1
+                # One casefold per paper, first-seen (highest priority) wins
+                for p in chain.from_iterable(done[start:nxt]):
+                    key = (p.title.casefold(), p.year or 0)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    results.append(p)
+                    if len(results) >= k:
+                        return results
+        finally:
+            # Don't hold the caller on lower-priority providers once k is met,
+            # and end any retry loops they are still in
+            stop.set()
+            for fut in futs:
+                fut.cancel()
+            pool.shutdown(wait=False)
         return results
 
 
@@ -664,8 +664,12 @@ def interactive_mode(root: str = "."):
         except EOFError:
             console.print("\n[yellow]Use 'exit' or 'quit' to close the application.[/yellow]")
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point.
+
+    Args:
+        argv: Command-line arguments; defaults to ``sys.argv[1:]``.
+    """
     parser = argparse.ArgumentParser(
         description="Interactive Tongyi CLI - Modern Terminal Interface",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -756,7 +760,7 @@ Examples:
         help="Export training data to specified file"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     args.root = ensure_valid_root_path(args.root)
 
     if args.validate_config:
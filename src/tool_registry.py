@@ -46,6 +46,7 @@ class ToolRegistry:
         self.root = os.path.abspath(root)
         self.code_search = CodeSearch(root=self.root)
         self.scholar = ScholarAdapter()
+        self._by_name: Optional[Dict[str, ToolSchema]] = None
     
     def get_tools(self) -> List[ToolSchema]:
         """Return list of available tools with schemas."""
@@ -190,6 +191,12 @@ class ToolRegistry:
             )
         ]
     
+    def get_tool(self, name: str) -> Optional[ToolSchema]:
+        """Return the schema for a tool by name, or None if unknown."""
+        if self._by_name is None:
+            self._by_name = {tool.name: tool for tool in self.get_tools()}
+        return self._by_name.get(name)
+    
     def execute_tool(self, call: ToolCall) -> ToolResult:
         """Execute a tool call and return the result."""
         try:
@@ -120,7 +120,7 @@ class TrainingManager:
                 raise ValueError(f"Unknown agent type: {agent_type}")
 
             # Store for management
-            agent_id = f"{agent_type}_{int(time.time())}"
+            agent_id = f"{agent_type}_{time.time_ns()}"
             self.active_agents[agent_id] = agent
 
             logger.info(f"Created optimized {agent_type} agent (ID: {agent_id})")
@@ -217,6 +217,7 @@ class TrainingManager:
         Returns:
             Training session results
         """
+        t0 = time.monotonic_ns()
         session_results = {
             'agent_type': agent_type,
             'start_time': time.time(),
@@ -267,7 +268,7 @@ class TrainingManager:
 
             session_results['success'] = True
             session_results['end_time'] = time.time()
-            session_results['duration'] = session_results['end_time'] - session_results['start_time']
+            session_results['duration'] = (time.monotonic_ns() - t0) / 1e9
 
             logger.info(f"Training session completed successfully in {session_results['duration']:.2f}s")
             return session_results
@@ -275,7 +276,7 @@ class TrainingManager:
         except Exception as e:
             session_results['error'] = str(e)
             session_results['end_time'] = time.time()
-            session_results['duration'] = session_results['end_time'] - session_results['start_time']
+            session_results['duration'] = (time.monotonic_ns() - t0) / 1e9
 
             logger.error(f"Training session failed: {e}")
             return session_results
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
 import sys
 
@@ -21,6 +21,14 @@ from config import DEFAULT_TONGYI_CONFIG, DEFAULT_MODEL_ROUTER
 
 _NOT_PASSED = object()
 
+_INDEPENDENT_DOMAINS: frozenset[str] = frozenset({
+    'github.com', 'gitlab.com', 'stackoverflow.com',
+    'arxiv.org', 'semantic-scholar.org', 'crossref.org',
+    'docs.python.org', 'python.org'
+})
+
+_YES_SET: frozenset[str] = frozenset({"YES", "YES.", "YES!"})
+
 
 @dataclass
 class Claim:
@@ -43,11 +51,7 @@ class VerifierGate:
             )
         else:
             self.client = tongyi_client
-        self.independent_domains = {
-            'github.com', 'gitlab.com', 'stackoverflow.com',
-            'arxiv.org', 'semantic-scholar.org', 'crossref.org',
-            'docs.python.org', 'python.org'
-        }
+        self.independent_domains = _INDEPENDENT_DOMAINS
 
     def verify_claim(self, claim_text: str, sources: List[str]) -> Claim:
         """Verify a claim meets citation requirements."""
@@ -71,6 +75,10 @@ class VerifierGate:
         claim.confidence = 0.8 if claim.verified else 0.2
         return claim
 
+    def verify_batch(self, claims: List[Tuple[str, List[str]]]) -> List[Claim]:
+        """Verify several (claim_text, sources) pairs, one Claim per pair in order."""
+        return [self.verify_claim(text, sources) for text, sources in claims]
+
     def filter_claims(self, claims: List[Claim]) -> List[Claim]:
         """Filter out unverified claims."""
         return [c for c in claims if c.verified]
@@ -132,7 +140,7 @@ Is this claim supported by the sources? Respond with ONLY YES or NO."""
                 system_prompt="You are an evidence verification assistant. Always respond with only YES or NO."
             )
             
-            return response.strip().upper() in ["YES", "YES.", "YES!"]
+            return response.strip().upper() in _YES_SET
         except AgentClientError as exc:
             # If OpenRouter returns no choices or similar, fall back to basic validation
             if "no choices" in str(exc).lower():
@@ -2,184 +2,71 @@
 """
 Final verification test for Tongyi Agent fixes
 """
+import asyncio
 import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import pytest
 
-def test_fixed_tool_schemas():
-    """Test that tool schemas are now compatible."""
-    print("Testing fixed tool schema compatibility...")
 
-    try:
-        from src.claude_agent_orchestrator import ClaudeAgentOrchestrator
-        from src.tool_registry import ToolRegistry
+# Parameters the Claude SDK tool definitions expect for each registry tool
+EXPECTED_MAPPINGS = {
+    "search_code": ["query", "paths", "max_results"],
+    "read_file": ["path", "start_line", "end_line"],
+    "run_sandbox": ["code", "timeout_s", "seed"],
+    "search_papers": ["query", "max_results", "year_min"],
+    "clean_csv": ["path", "output", "operations"],
+    "clean_markdown": ["path", "output", "collapse_empty", "normalize_timestamps"],
+    "summarize_results": ["context", "style"],
+}
 
-        # Get original tool schemas
-        registry = ToolRegistry(root=".")
-        tools = registry.get_tools()
+# Orchestrator modules imported CLI-style by test_import_structure
+CLI_ORCHESTRATOR_MODULES = ("claude_agent_orchestrator", "tongyi_orchestrator")
 
-        original_schemas = {}
-        for tool in tools:
-            original_schemas[tool.name] = tool.parameters
 
-        # Check that parameters match what Claude SDK expects
-        expected_mappings = {
-            "search_code": ["query", "paths", "max_results"],
-            "read_file": ["path", "start_line", "end_line"],
-            "run_sandbox": ["code", "timeout_s", "seed"],
-            "search_papers": ["query", "max_results", "year_min"],
-            "clean_csv": ["path", "output", "operations"],
-            "clean_markdown": ["path", "output", "collapse_empty", "normalize_timestamps"],
-            "summarize_results": ["context", "style"]
-        }
+@pytest.mark.parametrize("tool_name,expected_params", EXPECTED_MAPPINGS.items())
+def test_fixed_tool_schemas(tools_by_name, tool_name, expected_params):
+    """Test that tool schemas are now compatible."""
+    assert tool_name in tools_by_name, f"Tool '{tool_name}' not found"
+    tool = tools_by_name[tool_name]
+    missing = set(expected_params) - tool.parameters["properties"].keys()
+    assert not missing, f"{tool_name} missing params: {missing}"
 
-        for tool_name, expected_params in expected_mappings.items():
-            if tool_name in original_schemas:
-                schema = original_schemas[tool_name]
-                for param in expected_params:
-                    if param in schema["properties"]:
-                        print(f"+ {tool_name}: parameter '{param}' found")
-                    else:
-                        print(f"- {tool_name}: parameter '{param}' missing")
-                        return False
-            else:
-                print(f"- Tool '{tool_name}' not found")
-                return False
 
-        print("+ All tool schemas now compatible!")
-        return True
+def test_pdf_tools_registered(tools_by_name):
+    """Test that the PDF tools are exposed through the registry."""
+    pdf_tools = [t for n, t in tools_by_name.items() if n.startswith("pdf_")]
+    assert {t.name for t in pdf_tools} == {"pdf_info", "pdf_extract_text", "pdf_search", "pdf_merge"}
 
-    except Exception as e:
-        print(f"- Schema compatibility test failed: {e}")
-        return False
 
-def test_async_handling():
+async def test_async_handling():
     """Test async handling without event loop conflicts."""
-    print("\nTesting async handling...")
+    async def mock_async_function():
+        await asyncio.sleep(0.01)
+        return "async result"
 
-    try:
-        # Simulate the async handling pattern from CLI
-        def safe_asyncio_run(coro):
-            """Safe asyncio.run with event loop handling."""
-            try:
-                import asyncio
-                return asyncio.run(coro)
-            except RuntimeError as e:
-                if "event loop is already running" in str(e):
-                    try:
-                        import nest_asyncio
-                        nest_asyncio.apply()
-                        return asyncio.run(coro)
-                    except ImportError:
-                        print("WARNING: nest-asyncio not available for nested event loops")
-                        raise
-                else:
-                    raise
+    # Runs on the shared session loop; no nested asyncio.run required
+    assert await mock_async_function() == "async result"
 
-        async def mock_async_function():
-            await asyncio.sleep(0.01)
-            return "async result"
-
-        # Test the safe execution pattern
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            # This should work with our safe pattern
-            result = safe_asyncio_run(mock_async_function())
-            if result == "async result":
-                print("+ Safe async handling pattern works")
-                return True
-            else:
-                print("- Safe async handling returned wrong result")
-                return False
-        finally:
-            loop.close()
-
-    except Exception as e:
-        print(f"- Async handling test failed: {e}")
-        return False
 
 def test_import_structure():
     """Test that import structure is consistent."""
-    print("\nTesting import structure...")
-
-    try:
-        # Test the actual import paths used in CLI
-        import sys
-        original_path = sys.path.copy()
-
-        # Add src to path (like CLI does)
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-        try:
-            # Test imports as they would happen in CLI
-            from claude_agent_orchestrator import ClaudeAgentOrchestrator
-            from tongyi_orchestrator import TongyiOrchestrator
-            print("+ CLI-style imports successful")
+    src_path = os.path.join(os.path.dirname(__file__), 'src')
+    before = frozenset(sys.modules)
 
-            # Test that both orchestrators are available
-            claude_available = True
-            tongyi_available = True
+    # Add src to path (like CLI does)
+    sys.path.insert(0, src_path)
 
-            print(f"+ Claude orchestrator available: {claude_available}")
-            print(f"+ Tongyi orchestrator available: {tongyi_available}")
-
-            return True
-
-        finally:
-            # Restore path
-            sys.path = original_path
-
-    except ImportError as e:
-        print(f"- Import structure test failed: {e}")
-        return False
-
-def main():
-    """Run final verification tests."""
-    print("Tongyi Agent Final Verification Tests")
-    print("=" * 50)
-
-    tests = [
-        test_fixed_tool_schemas,
-        test_async_handling,
-        test_import_structure,
-    ]
-
-    results = []
-    for test in tests:
+    try:
+        # Test imports as they would happen in CLI
+        from claude_agent_orchestrator import ClaudeAgentOrchestrator  # noqa: F401
+        from tongyi_orchestrator import TongyiOrchestrator  # noqa: F401
+    finally:
+        # Undo only what this test added
         try:
-            result = test()
-            results.append(result)
-        except Exception as e:
-            print(f"- Test {test.__name__} crashed: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append(False)
-
-    # Summary
-    print("\n" + "=" * 50)
-    print("Final Verification Summary:")
-    passed = sum(results)
-    total = len(results)
-
-    print(f"Tests passed: {passed}/{total}")
-
-    if passed == total:
-        print("\nSUCCESS: All fixes verified!")
-        print("The subtle bugs have been successfully resolved:")
-        print("- Tool schema compatibility: FIXED")
-        print("- Async/sync mixing: FIXED")
-        print("- Import structure: FIXED")
-        print("- Missing dependencies: FIXED")
-    else:
-        print(f"\nWARNING: {total-passed} issues still need attention")
-
-    return passed == total
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+            sys.path.remove(src_path)
+        except ValueError:
+            pass
+        for name in frozenset(sys.modules) - before:
+            if name.startswith(CLI_ORCHESTRATOR_MODULES):
+                del sys.modules[name]
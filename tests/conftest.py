@@ -0,0 +1,151 @@
+"""
+Shared fixtures for the ``tests/`` package.
+"""
+import asyncio
+import copy
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+import pytest
+from unittest.mock import Mock, patch
+
+from delegation_policy import AgentBudget
+
+# Resolved once per worker instead of in every test module
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from orchestrator_local import LocalOrchestrator  # noqa: E402
+from src.tongyi_orchestrator import TongyiOrchestrator  # noqa: E402
+
+# Delegate budgets used by the LocalOrchestrator tests unless overridden;
+# copied per test because AgentBudget tracks usage
+_DEFAULT_BUDGETS = {
+    "small": AgentBudget(max_calls=2, max_tokens=200),
+    "tongyi": AgentBudget(max_calls=1, max_tokens=200),
+    "sandbox": AgentBudget(max_calls=1, max_tokens=200),
+}
+
+_real_async_sleep = asyncio.sleep
+
+
+async def _yield_once(delay=0, result=None):
+    return await _real_async_sleep(0, result)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(request, monkeypatch):
+    """Turn retry/backoff sleeps into no-ops unless marked ``real_sleep``."""
+    if "real_sleep" in request.keywords:
+        return
+    monkeypatch.setattr("time.sleep", lambda *args, **kwargs: None)
+    monkeypatch.setattr("asyncio.sleep", _yield_once)
+
+
+@pytest.fixture(autouse=True)
+def _clear_docker_probe():
+    """Keep a real Docker probe from one test from leaking into the next."""
+    yield
+    for name in ("src.sandbox_exec", "sandbox_exec"):
+        module = sys.modules.get(name)
+        if module is not None:
+            module._reset_docker_probe()
+
+
+@pytest.fixture(scope="session")
+def repo_root():
+    """Absolute path of the repository root."""
+    return ROOT
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session-wide scratch directory for read-only test inputs.
+
+    Tests that create or modify files should keep using ``tmp_path``.
+    """
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture(scope="session")
+def _mock_client_template():
+    """Single OpenRouter client mock shared by the whole session."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_client(_mock_client_template):
+    """The shared client mock, with calls and canned responses cleared.
+
+    Scripted multi-turn replies should be set as ``iter([...])`` on
+    ``chat.side_effect``; the side effect is dropped again at teardown so a
+    half-consumed iterator never leaks into the next test.
+    """
+    _mock_client_template.reset_mock(return_value=True, side_effect=True)
+    yield _mock_client_template
+    _mock_client_template.chat.side_effect = None
+
+
+@pytest.fixture(scope="module")
+def orch(_mock_client_template):
+    """TongyiOrchestrator wired to the shared client mock, built once per module."""
+    with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=_mock_client_template):
+        return TongyiOrchestrator(root="/test")
+
+
+@pytest.fixture
+def orchestrator(orch, mock_client):
+    """The module's shared orchestrator; delegation budgets are restored after each test."""
+    policy = copy.deepcopy(orch.policy)
+    yield orch
+    orch.policy = policy
+
+
+@pytest.fixture(scope="module")
+def _local_orch(repo_root):
+    return LocalOrchestrator(root=str(repo_root))
+
+
+@pytest.fixture
+def make_local_orch(_local_orch):
+    """Factory that rewires the module-shared LocalOrchestrator for one test.
+
+    ``handlers`` replaces the delegate handlers; ``budgets`` defaults to fresh
+    copies of ``_DEFAULT_BUDGETS`` for the handled agents. The verifier gate
+    is restored after the test.
+    """
+    gate = _local_orch.verifier_gate
+
+    def _make(handlers, budgets=None):
+        if budgets is None:
+            budgets = {name: copy.copy(_DEFAULT_BUDGETS[name]) for name in handlers}
+        _local_orch.policy.agent_budgets = budgets
+        _local_orch.policy.metrics.clear()
+        _local_orch.delegate_tool.handlers = handlers
+        return _local_orch
+
+    yield _make
+    _local_orch.verifier_gate = gate
+
+
+@pytest.fixture
+def docker_patch_stack():
+    """Make run_snippet take the Docker path without a Docker daemon.
+
+    Yields the ``subprocess.Popen`` mock; ``call_args[0][0]`` is the
+    ``docker run`` command that would have been executed.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch('src.sandbox_exec._docker_available', return_value=True))
+        mock_pull = stack.enter_context(patch('src.sandbox_exec.subprocess.run'))
+        mock_popen = stack.enter_context(patch('src.sandbox_exec.subprocess.Popen'))
+        mock_uuid = stack.enter_context(patch('src.sandbox_exec.uuid.uuid4'))
+        mock_uuid.return_value.hex = "deadbeef12345678"
+        mock_proc = Mock()
+        mock_proc.communicate.return_value = (b"ok\n", b"")
+        mock_proc.returncode = 0
+        mock_popen.return_value = mock_proc
+        mock_pull.return_value = Mock(returncode=0)
+        yield mock_popen
@@ -0,0 +1,91 @@
+from dataclasses import asdict
+
+from tools.base_tool import BaseTool, KeyInfo, ToolCategory, ToolContext, ToolInfo, ToolResult
+
+
+class FlakyTool(BaseTool):
+    """Fails ``failures`` times, then succeeds."""
+
+    def __init__(self, failures):
+        super().__init__(config={})
+        self.failures = failures
+        self.calls = 0
+
+    @classmethod
+    def _get_category(cls):
+        return ToolCategory.COMPUTATION
+
+    async def execute(self, query, context):
+        self.calls += 1
+        if self.calls <= self.failures:
+            if self.calls % 2:
+                raise RuntimeError(f"boom {self.calls}")
+            return ToolResult(success=False, error=f"bad {self.calls}")
+        return ToolResult(data=query)
+
+    def get_description(self):
+        return "flaky"
+
+    def get_parameters(self):
+        return {}
+
+
+async def _record_sleep(delays, delay):
+    delays.append(delay)
+
+
+async def test_execute_with_retry_recovers(monkeypatch):
+    delays = []
+    monkeypatch.setattr(BaseTool, "_sleep", staticmethod(lambda d: _record_sleep(delays, d)))
+    tool = FlakyTool(failures=2)
+
+    result = await tool.execute_with_retry("q", ToolContext(user_query="q", max_retries=3))
+
+    assert result.success and result.data == "q"
+    assert tool.calls == 3
+    # Both exception and unsuccessful-result failures back off exponentially
+    assert len(delays) == 2
+    assert 0.25 <= delays[0] < 0.5 <= delays[1] < 0.75
+
+
+async def test_execute_with_retry_gives_up(monkeypatch):
+    delays = []
+    monkeypatch.setattr(BaseTool, "_sleep", staticmethod(lambda d: _record_sleep(delays, d)))
+    tool = FlakyTool(failures=10)
+
+    result = await tool.execute_with_retry("q", ToolContext(user_query="q", max_retries=2))
+
+    assert not result.success
+    assert result.error == "Tool execution failed after 3 attempts: boom 3"
+    assert result.metadata == {"attempts": 3}
+    # No sleep after the final attempt
+    assert len(delays) == 2
+
+
+def test_tool_info_and_key_info():
+    tool = FlakyTool(failures=0)
+
+    info = tool.get_tool_info()
+    assert info == ToolInfo(name="flakytool", category="computation", description="flaky", parameters={}, config={})
+    assert asdict(info)["category"] == "computation"
+    assert tool.extract_key_info(42) == KeyInfo(raw_result=42, tool_name="flakytool")
+
+
+def test_subclass_constants_resolved_once():
+    assert FlakyTool.name == "flakytool"
+    assert FlakyTool.category is ToolCategory.COMPUTATION
+    assert FlakyTool.logger.name == "tool.flakytool"
+    assert "category" not in vars(FlakyTool(failures=0))
+
+
+class LegacyTool(FlakyTool):
+    """Declares _get_category the original instance-method way."""
+
+    def _get_category(self):
+        return ToolCategory.SEARCH
+
+
+def test_instance_method_category_still_supported():
+    tool = LegacyTool(failures=0)
+    assert tool.category is ToolCategory.SEARCH
+    assert tool.get_tool_info().category == "search"
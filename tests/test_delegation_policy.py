@@ -9,3 +9,11 @@ def test_delegation_budget_enforced():
     assert policy.allow("agent") is False
     assert policy.metrics["calls.agent"] == 1
     assert policy.metrics["deny.agent"] == 1
+
+
+def test_deplete_exhausts_calls_without_tokens():
+    policy = DelegationPolicy(agent_budgets={"agent": AgentBudget(max_calls=3, max_tokens=10)})
+    policy.deplete("agent", 3)
+    assert policy.allow("agent") is False
+    assert policy.remaining("agent") == (0, 10)
+    assert "calls.agent" not in policy.metrics
@@ -1,147 +1,109 @@
 """
 Integration tests for Tongyi Agent.
 """
+import logging
+from types import SimpleNamespace as NS
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
+
+from src.tool_registry import ToolResult
+
+# Canned search_code result; the orchestrator only serializes it
+_SEARCH_CODE_RESULT = ToolResult(name="search_code", result=("file1.py", "file2.py", "file3.py"))
 
-from src.tongyi_orchestrator import TongyiOrchestrator
+# Restores the shared orchestrator's delegation budgets after each test
+pytestmark = pytest.mark.usefixtures("orchestrator")
 
 
 class TestIntegration:
     """Integration tests for the complete Tongyi Agent system."""
     
-    def test_end_to_end_simple_question(self):
+    def test_end_to_end_simple_question(self, orch, mock_client):
         """Test end-to-end flow with a simple question."""
-        mock_client = Mock()
         mock_client.chat.return_value = "The answer is 42."
         
-        with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=mock_client):
-            orch = TongyiOrchestrator(root="/test")
-            result = orch.run("What is the meaning of life?")
-            
-            assert "42" in result
-            assert mock_client.chat.called
+        result = orch.run("What is the meaning of life?")
+        
+        assert "42" in result
+        assert mock_client.chat.called
     
-    def test_tool_call_integration(self):
+    def test_tool_call_integration(self, orch, mock_client):
         """Test tool calling in integration."""
-        mock_client = Mock()
-        
-        # Create properly structured mock for tool call
-        mock_function = Mock()
-        mock_function.name = "search_code"
-        mock_function.arguments = '{"query": "test", "max_results": 5}'
-        
-        mock_tool_call = Mock()
-        mock_tool_call.id = "call_123"
-        mock_tool_call.function = mock_function
-        
         # First response: tool call
-        tool_response = Mock()
-        tool_response.tool_calls = [mock_tool_call]
+        tool_response = NS(tool_calls=[
+            NS(id="call_123", function=NS(name="search_code", arguments='{"query": "test", "max_results": 5}'))
+        ])
         
         # Second response: final answer (no tool calls)
-        final_response = Mock()
-        final_response.tool_calls = None
+        final_response = NS(tool_calls=None)
         
-        mock_client.chat.side_effect = [tool_response, final_response]
+        mock_client.chat.side_effect = iter([tool_response, final_response])
         
-        with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=mock_client):
-            orch = TongyiOrchestrator(root="/test")
+        with patch.object(orch.tools, 'execute_tool') as mock_execute:
+            mock_execute.return_value = _SEARCH_CODE_RESULT
             
-            with patch.object(orch.tools, 'execute_tool') as mock_execute:
-                from src.tool_registry import ToolResult
-                mock_execute.return_value = ToolResult(
-                    name="search_code",
-                    result=["file1.py", "file2.py", "file3.py"]
-                )
-                
-                result = orch.run("Find test functions")
-                
-                # Verify tool was called
-                assert mock_execute.called
+            result = orch.run("Find test functions")
+            
+            # Verify tool was called
+            assert mock_execute.called
     
-    def test_budget_enforcement_integration(self):
+    def test_budget_enforcement_integration(self, orch, mock_client):
         """Test that budgets are enforced in integration."""
-        mock_client = Mock()
+        # Deplete budget for search_papers
+        orch.policy.deplete("search_papers", 5)  # Exceeds the budget of 3
+        assert not orch.policy.allow("search_papers")
         
-        # Mock budget exceeded
-        with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=mock_client):
-            orch = TongyiOrchestrator(root="/test")
-            
-            # Deplete budget for search_papers
-            for _ in range(5):  # Exceeds the budget of 3
-                orch.policy.allow("search_papers")
-            
-            tool_response = Mock()
-            tool_response.tool_calls = [
-                Mock(
-                    id="call_123",
-                    function=Mock(
-                        name="search_papers",
-                        arguments='{"query": "test"}'
-                    )
-                )
-            ]
-            mock_client.chat.return_value = tool_response
-            
-            result = orch.run("Search for papers")
-            
-            # Should handle budget exceeded gracefully
-            assert result is not None
+        tool_response = NS(tool_calls=[
+            NS(id="call_123", function=NS(name="search_papers", arguments='{"query": "test"}'))
+        ])
+        mock_client.chat.return_value = tool_response
+        
+        result = orch.run("Search for papers")
+        
+        # Should handle budget exceeded gracefully
+        assert result is not None
     
-    def test_local_first_behavior_in_system_prompt(self):
+    def test_local_first_behavior_in_system_prompt(self, orch, mock_client):
         """Test that system prompt contains local-first instructions."""
-        mock_client = Mock()
+        prompt = orch.system_prompt
+        lower = prompt.lower()
         
-        with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=mock_client):
-            orch = TongyiOrchestrator(root="/test")
-            
-            prompt = orch.system_prompt
-            
-            # Check for local-first behavior
-            assert "local" in prompt.lower()
-            assert "first" in prompt.lower()
-            assert "search_code" in prompt
-            assert "read_file" in prompt
-            assert "search_papers" in prompt
+        # Check for local-first behavior
+        assert all(tok in lower for tok in ("local", "first"))
+        assert all(tok in prompt for tok in ("search_code", "read_file", "search_papers"))
     
-    def test_error_handling_integration(self):
+    def test_error_handling_integration(self, orch, mock_client):
         """Test error handling in integration."""
-        mock_client = Mock()
-        mock_client.chat.side_effect = Exception("API Error")
+        mock_client.chat.side_effect = RuntimeError("API Error")
         
-        with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=mock_client):
-            orch = TongyiOrchestrator(root="/test")
-            
-            # Should catch the exception and handle it gracefully
-            with pytest.raises(Exception):  # The exception should propagate
-                orch.run("Test error")
+        # Only AgentClientError is turned into an offline response; anything
+        # else the client raises propagates unchanged
+        with pytest.raises(RuntimeError, match="API Error"):
+            orch.run("Test error")
     
-    def test_logging_integration(self):
+    def test_logging_integration(self, orch, mock_client, caplog):
         """Test that logging works in integration."""
-        mock_client = Mock()
         mock_client.chat.return_value = "Simple answer"
         
-        with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=mock_client):
-            with patch('src.tongyi_orchestrator.logger') as mock_logger:
-                orch = TongyiOrchestrator(root="/test")
-                orch.run("Test logging")
-                
-                # Should log the start and completion
-                assert mock_logger.info.called
+        with caplog.at_level(logging.INFO, logger="src.tongyi_orchestrator"):
+            orch.run("Test logging")
+        
+        # Should log the start and completion on the orchestrator's logger
+        orch_records = [
+            r for r in caplog.records
+            if r.name == "src.tongyi_orchestrator" and r.levelno == logging.INFO
+        ]
+        assert any(r.getMessage().startswith("Starting Tongyi orchestrator") for r in orch_records)
     
-    def test_verification_integration(self):
+    def test_verification_integration(self, orch, mock_client):
         """Test that verification is applied to final answers."""
-        mock_client = Mock()
         mock_client.chat.return_value = "Answer with sources"
         
-        with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=mock_client):
-            orch = TongyiOrchestrator(root="/test")
+        with patch.object(orch, '_verify_response') as mock_verify:
+            mock_verify.return_value = "Verified answer"
+            
+            result = orch.run("Test verification")
             
-            with patch.object(orch, '_verify_response') as mock_verify:
-                mock_verify.return_value = "Verified answer"
-                
-                result = orch.run("Test verification")
-                
-                assert result == "Verified answer"
-                mock_verify.assert_called_once()
+            assert result == "Verified answer"
+            mock_verify.assert_called_once()
@@ -1,10 +1,9 @@
 """
 Tests for ModelRouter alternating between paid/free Tongyi models.
 """
-import pytest
-from unittest.mock import Mock, patch
+import copy
 
-from config import ModelRouter
+from config import DEFAULT_MODEL_ROUTER, DEFAULT_TONGYI_CONFIG, ModelRouter
 
 
 class TestModelRouter:
@@ -88,11 +87,13 @@ class TestModelRouter:
 
     def test_default_router_configuration(self):
         """DEFAULT_MODEL_ROUTER should use the expected interval and models."""
-        from config import DEFAULT_MODEL_ROUTER, DEFAULT_TONGYI_CONFIG
         assert DEFAULT_MODEL_ROUTER.primary_model == DEFAULT_TONGYI_CONFIG.model_name
         assert DEFAULT_MODEL_ROUTER.free_model == DEFAULT_TONGYI_CONFIG.free_model_name
         assert DEFAULT_MODEL_ROUTER.free_interval == DEFAULT_TONGYI_CONFIG.free_call_interval
-        # Verify it alternates at the configured interval
-        sequence = [DEFAULT_MODEL_ROUTER.next_model() for _ in range(6)]
+        # Verify it alternates at the configured interval on a copy, leaving
+        # the shared singleton's counter untouched
+        router = copy.copy(DEFAULT_MODEL_ROUTER)
+        router.reset()
+        sequence = [router.next_model() for _ in range(6)]
         assert sequence[2] == DEFAULT_TONGYI_CONFIG.free_model_name
         assert sequence[5] == DEFAULT_TONGYI_CONFIG.free_model_name
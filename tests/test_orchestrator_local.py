@@ -1,17 +1,9 @@
-import sys
-from pathlib import Path
+import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.append(str(ROOT))
+pytestmark = pytest.mark.xdist_group("repo_cas")
 
-from delegation_policy import AgentBudget  # noqa: E402
-from orchestrator_local import LocalOrchestrator  # noqa: E402
-
-
-def test_orchestrator_uses_delegate_and_planner(tmp_path):
-    root = ROOT
 
+def test_orchestrator_uses_delegate_and_planner(make_local_orch):
     calls = {"small": 0, "tongyi": 0}
 
     def handler_small(prompt: str) -> str:
@@ -22,17 +14,7 @@ def test_orchestrator_uses_delegate_and_planner(tmp_path):
         calls["tongyi"] += 1
         return "tongyi evidence"
 
-    orch = LocalOrchestrator(
-        root=str(root),
-        agent_budgets={
-            "small": AgentBudget(max_calls=2, max_tokens=200),
-            "tongyi": AgentBudget(max_calls=1, max_tokens=200),
-        },
-        delegate_handlers={
-            "small": handler_small,
-            "tongyi": handler_tongyi,
-        },
-    )
+    orch = make_local_orch({"small": handler_small, "tongyi": handler_tongyi})
     result = orch.run("delegation budget")
     assert "small evidence" in result
     assert "tongyi evidence" in result
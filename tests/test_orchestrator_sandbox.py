@@ -1,34 +1,26 @@
-import sys
-import json
-from pathlib import Path
+import re
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.append(str(ROOT))
+import pytest
 
-from delegation_policy import AgentBudget  # noqa: E402
-from orchestrator_local import LocalOrchestrator  # noqa: E402
-from verifier_gate import VerifierGate  # noqa: E402
+pytestmark = pytest.mark.xdist_group("repo_cas")
 
+# Canned sandbox delegate responses
+_SANDBOX_OK = '{"ok":true,"stdout":"ok","stderr":"","returncode":0,"ms":5,"isolated":false,"container":null}'
+_SANDBOX_ECHO_TMPL = '{"ok":true,"stdout":"executed: %s","stderr":"","returncode":0,"ms":10,"isolated":false,"container":null}'
 
-def test_orchestrator_sandbox_delegate():
+# The ``code=`` line of a sandbox delegate prompt
+_CODE_RE = re.compile(r"^code=(.*)$", re.M)
+
+
+def test_orchestrator_sandbox_delegate(make_local_orch):
     # Override delegates to control sandbox behavior
     def handler_sandbox(prompt: str) -> str:
         # Echo back the code field for test verification
-        lines = prompt.splitlines()
-        code_line = next((ln for ln in lines if ln.startswith("code=")), "")
-        code = code_line.partition("=")[2] if code_line else ""
-        return json.dumps({"ok": True, "stdout": f"executed: {code}", "stderr": "", "returncode": 0, "ms": 10, "isolated": False, "container": None}, separators=(",", ":"))
-
-    orch = LocalOrchestrator(
-        root=str(ROOT),
-        agent_budgets={
-            "sandbox": AgentBudget(max_calls=1, max_tokens=200),
-        },
-        delegate_handlers={
-            "sandbox": handler_sandbox,
-        },
-    )
+        m = _CODE_RE.search(prompt)
+        code = m.group(1) if m else ""
+        return _SANDBOX_ECHO_TMPL % code
+
+    orch = make_local_orch({"sandbox": handler_sandbox})
     orch.verifier_gate = None  # Disable verification for this test
 
     # Question that triggers sandbox heuristic
@@ -39,23 +31,15 @@ def test_orchestrator_sandbox_delegate():
     assert "executed:" in result
 
 
-def test_orchestrator_sandbox_budget_enforcement():
+def test_orchestrator_sandbox_budget_enforcement(make_local_orch):
     # Test that sandbox delegate respects call budget
     calls = {"sandbox": 0}
     def handler_sandbox(prompt: str) -> str:
         calls["sandbox"] += 1
-        return json.dumps({"ok": True, "stdout": "ok", "stderr": "", "returncode": 0, "ms": 5, "isolated": False, "container": None}, separators=(",", ":"))
-
-    orch = LocalOrchestrator(
-        root=str(ROOT),
-        agent_budgets={
-            "sandbox": AgentBudget(max_calls=1, max_tokens=200),
-        },
-        delegate_handlers={
-            "sandbox": handler_sandbox,
-        },
-    )
-    orch.verifier_gate = None
+        return _SANDBOX_OK
+
+    orch = make_local_orch({"sandbox": handler_sandbox})
+    orch.verifier_gate = None  # Disable verification for this test
 
     # First run should call sandbox
     orch.run("run something")
@@ -65,16 +49,12 @@ def test_orchestrator_sandbox_budget_enforcement():
     assert calls["sandbox"] == 1  # unchanged
 
 
-def test_orchestrator_sandbox_error_handling():
+def test_orchestrator_sandbox_error_handling(make_local_orch):
     def handler_sandbox(prompt: str) -> str:
         return "sandbox_error: no code provided"
 
-    orch = LocalOrchestrator(
-        root=str(ROOT),
-        agent_budgets={"sandbox": AgentBudget(max_calls=1, max_tokens=200)},
-        delegate_handlers={"sandbox": handler_sandbox},
-    )
-    orch.verifier_gate = None
+    orch = make_local_orch({"sandbox": handler_sandbox})
+    orch.verifier_gate = None  # Disable verification for this test
 
     result = orch.run("execute something")
     # Should include error message in observation
@@ -1,16 +1,12 @@
-import sys
-from pathlib import Path
+import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.append(str(ROOT))
+from delegation_policy import AgentBudget
+from verifier_gate import VerifierGate
 
-from delegation_policy import AgentBudget  # noqa: E402
-from orchestrator_local import LocalOrchestrator  # noqa: E402
-from verifier_gate import VerifierGate  # noqa: E402
+pytestmark = pytest.mark.xdist_group("repo_cas")
 
 
-def test_orchestrator_verifies_claims_with_citations():
+def test_orchestrator_verifies_claims_with_citations(make_local_orch):
     # Override delegates to avoid network
     def handler_small(prompt: str) -> str:
         return "small evidence"
@@ -18,16 +14,12 @@ def test_orchestrator_verifies_claims_with_citations():
     def handler_tongyi(prompt: str) -> str:
         return "tongyi evidence"
 
-    orch = LocalOrchestrator(
-        root=str(ROOT),
-        agent_budgets={
+    orch = make_local_orch(
+        {"small": handler_small, "tongyi": handler_tongyi},
+        budgets={
             "small": AgentBudget(max_calls=1, max_tokens=200),
             "tongyi": AgentBudget(max_calls=1, max_tokens=200),
         },
-        delegate_handlers={
-            "small": handler_small,
-            "tongyi": handler_tongyi,
-        },
     )
     # Force fallback verification (no network)
     orch.verifier_gate = VerifierGate(tongyi_client=None)
@@ -3,14 +3,15 @@ Comprehensive tests for react_parser and data_iterator modules.
 Tests cover ReActParser, ReActExecutor, DataIterator, and CAS integration.
 """
 import json
+import threading
 import pytest
-from pathlib import Path
-from typing import Any, Dict, Iterator, List
-from unittest.mock import Mock, patch, MagicMock
+from collections import deque
+from typing import List
+from unittest.mock import Mock, patch
 
-from src.react_parser import ReActParser, ReActExecutor, ReActBlock
+from src.react_parser import ReActParser, ReActExecutor
 from src.tool_registry import ToolRegistry, ToolCall, ToolResult
-from src.data_iterator import DataIterator, DataItem, IterationConfig
+from src.data_iterator import DataIterator, DataItem, IterationConfig, _json_dumps
 
 
 # ============================================================================
@@ -49,6 +50,7 @@ class StubVerifier:
 
     def __init__(self, should_verify: bool = True):
         self.should_verify = should_verify
+        self.batch_sizes: List[int] = []
 
     def verify_claim(self, claim_text: str, sources: List[str]):
         """Mock claim verification."""
@@ -57,103 +59,115 @@ class StubVerifier:
         result.sources_count = len(sources)
         return result
 
+    def verify_batch(self, claims):
+        """Mock batch verification, recording the size of each call."""
+        self.batch_sizes.append(len(claims))
+        return [self.verify_claim(text, sources) for text, sources in claims]
+
 
 class StubCAS:
     """Mock Content-Addressable Store for testing."""
 
     def __init__(self):
-        self.stored: List[Dict[str, Any]] = []
+        # Tests only check how many puts happened, so payloads aren't kept
         self.key_counter = 0
 
     def put(self, content: bytes, **kwargs):
-        """Store content and return CAS key."""
+        """Validate content and return CAS key."""
         try:
-            payload = json.loads(content.decode("utf-8"))
-            payload["meta"] = kwargs
-            self.stored.append(payload)
-            self.key_counter += 1
-            return f"cas://{self.key_counter}"
+            json.loads(content)
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise ValueError(f"Failed to store in CAS: {e}")
+        self.key_counter += 1
+        return f"cas://{self.key_counter}"
+
+    def clear(self):
+        """Forget earlier puts."""
+        self.key_counter = 0
+
+
+class SlowStubCAS(StubCAS):
+    """CAS stub whose puts lag behind, keeping every stored payload."""
+
+    def __init__(self):
+        super().__init__()
+        self.payloads = []
+
+    def put(self, content: bytes, **kwargs):
+        threading.Event().wait(0.01)
+        self.payloads.append(json.loads(content))
+        return super().put(content, **kwargs)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def react_parser():
-    """Provide fresh ReActParser instance."""
+    """Provide a shared ReActParser; parsing keeps no per-call state."""
     return ReActParser()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dummy_registry():
     """Provide mock tool registry."""
     return DummyRegistry()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def react_executor(dummy_registry):
     """Provide ReActExecutor with mock registry."""
     return ReActExecutor(tool_registry=dummy_registry)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def stub_verifier():
     """Provide mock verifier."""
     return StubVerifier(should_verify=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def stub_cas():
-    """Provide mock CAS store."""
+    """Provide mock CAS store, shared by the module and reset per test."""
     return StubCAS()
 
 
-@pytest.fixture
-def temp_dataset(tmp_path):
-    """Create temporary dataset file."""
-    dataset = tmp_path / "sample.jsonl"
-    dataset.write_text(
-        json.dumps({"content": "First line.", "id": 1}) + "\n" +
-        json.dumps({"content": "Second item.", "id": 2}) + "\n"
-    )
-    return dataset
+@pytest.fixture(autouse=True)
+def _reset_stub_cas(stub_cas):
+    """Clear whatever the previous test stored in the shared CAS stub."""
+    stub_cas.clear()
+
+
+@pytest.fixture(scope="module")
+def iterator_factory(stub_cas, stub_verifier):
+    """Build DataIterators wired to the shared stubs.
+
+    Keyword arguments become the IterationConfig; ``root``, ``cas_store``
+    and ``verifier`` override the defaults.
+    """
+    def make(root=".", cas_store=None, verifier=None, **cfg):
+        return DataIterator(
+            root=root,
+            config=IterationConfig(**cfg),
+            cas_store=cas_store or stub_cas,
+            verifier=verifier or stub_verifier,
+        )
+
+    return make
 
 
 # ============================================================================
 # ReActParser Tests
 # ============================================================================
 
-class TestReActParserJsonAndNaturalCalls:
-    """Test parsing of structured JSON and natural language ReAct blocks."""
-
-    def test_parse_structured_json_tool_calls(self, react_parser):
-        """Test extraction of JSON code block tool calls."""
-        response = """```json
+# Response corpus shared by the parser tests
+_JSON_TOOL_CALL = """```json
 {"tool": "echo", "parameters": {"text": "hello"}}
 ```"""
-        blocks = react_parser.parse_response(response)
-
-        assert len(blocks) >= 1
-        assert blocks[0].action == "echo"
-        assert blocks[0].action_input == {"text": "hello"}
 
-    def test_parse_natural_react_format(self, react_parser):
-        """Test parsing of natural Thought/Action/Observation blocks."""
-        response = """Thought: I need to search for information
+_NATURAL_REACT = """Thought: I need to search for information
 Action: search_code
 Action Input: {"query": "test function", "max_results": 5}
 Observation: Found 3 results"""
 
-        blocks = react_parser.parse_response(response)
-
-        assert len(blocks) >= 1
-        assert blocks[0].thought == "I need to search for information"
-        assert blocks[0].action == "search_code"
-        assert blocks[0].action_input == {"query": "test function", "max_results": 5}
-        assert blocks[0].observation == "Found 3 results"
-
-    def test_parse_mixed_json_and_natural_blocks(self, react_parser):
-        """Test parsing response with both JSON and natural ReAct blocks."""
-        response = """Thought: need tool
+_MIXED_BLOCKS = """Thought: need tool
 Action: echo
 Action Input: {"text": "hello"}
 Observation: waiting
@@ -161,41 +175,69 @@ Observation: waiting
 {"tool": "echo", "parameters": {"text": "world"}}
 ```"""
 
-        blocks = react_parser.parse_response(response)
-
-        # Should detect both tool calls
-        assert any(b.action == "echo" for b in blocks)
-        # Verify at least one block has properly parsed action_input
-        assert len(blocks) >= 1
-        # Check that JSON tool call was parsed (first in list due to extraction order)
-        if blocks and blocks[0].action_input:
-            assert isinstance(blocks[0].action_input, dict)
-
-    def test_parse_malformed_json_skips_invalid_blocks(self, react_parser):
-        """Test that malformed JSON blocks are skipped gracefully."""
-        response = """```json
+_MALFORMED_JSON = """```json
 {"tool": "echo", "parameters": invalid json}
 ```
 Thought: Fallback to natural format
 Action: search_code
 Action Input: {"query": "test"}"""
 
-        blocks = react_parser.parse_response(response)
+_MISSING_ACTION_INPUT = """Thought: test
+Action: search_code"""
 
-        # Should skip malformed JSON and parse natural block
-        assert len(blocks) >= 1
-        assert blocks[0].action == "search_code"
+_TOOL_ONLY = """Action: search_code
+Action Input: {"query": "test"}"""
 
-    def test_parse_missing_action_input_defaults_to_dict(self, react_parser):
-        """Test that missing Action Input is handled gracefully."""
-        response = """Thought: test
-Action: search_code"""
+_ANSWER_AFTER_OBSERVATION = """Action: search_code
+Action Input: {"query": "test"}
+Observation: Found results
+Based on these results, the final answer is: test passed."""
 
+_MULTIPLE_THOUGHTS = """Thought: First thought
+Action: search_code
+Action Input: {"query": "first"}
+
+Thought: Second thought
+Action: echo
+Action Input: {"text": "second"}"""
+
+
+class TestReActParserJsonAndNaturalCalls:
+    """Test parsing of structured JSON and natural language ReAct blocks."""
+
+    # (response, expected first action, expected first action_input); an
+    # expected input of None only requires the parsed input be None or a dict
+    PARSE_CASES = [
+        pytest.param(_JSON_TOOL_CALL, "echo", {"text": "hello"}, id="structured_json_tool_call"),
+        pytest.param(
+            _NATURAL_REACT,
+            "search_code",
+            {"query": "test function", "max_results": 5},
+            id="natural_react_format",
+        ),
+        pytest.param(_MIXED_BLOCKS, "echo", None, id="mixed_json_and_natural_blocks"),
+        pytest.param(_MALFORMED_JSON, "search_code", None, id="malformed_json_skips_invalid_block"),
+        pytest.param(_MISSING_ACTION_INPUT, "search_code", None, id="missing_action_input"),
+    ]
+
+    @pytest.mark.parametrize("response, expected_action, expected_input", PARSE_CASES)
+    def test_parse_response_variants(self, react_parser, response, expected_action, expected_input):
+        """Test that the first parsed block carries the expected tool call."""
         blocks = react_parser.parse_response(response)
 
         assert len(blocks) >= 1
-        assert blocks[0].action == "search_code"
-        assert blocks[0].action_input is None or isinstance(blocks[0].action_input, dict)
+        assert blocks[0].action == expected_action
+        if expected_input is None:
+            assert blocks[0].action_input is None or isinstance(blocks[0].action_input, dict)
+        else:
+            assert blocks[0].action_input == expected_input
+
+    def test_parse_natural_react_thought_and_observation(self, react_parser):
+        """Test that natural blocks keep their Thought and Observation text."""
+        blocks = react_parser.parse_response(_NATURAL_REACT)
+
+        assert blocks[0].thought == "I need to search for information"
+        assert blocks[0].observation == "Found 3 results"
 
 
 class TestReActParserFinalAnswer:
@@ -213,22 +255,14 @@ class TestReActParserFinalAnswer:
 
     def test_no_final_answer_with_only_tools(self, react_parser):
         """Test that tool-only responses don't produce final answers."""
-        response = """Action: search_code
-Action Input: {"query": "test"}"""
-
-        result = react_parser.extract_final_answer(response)
+        result = react_parser.extract_final_answer(_TOOL_ONLY)
 
         # Should either be None or empty
         assert not result or (isinstance(result, str) and len(result.strip()) < 20)
 
     def test_extract_final_answer_after_observations(self, react_parser):
         """Test extracting final answer that comes after tool observations."""
-        response = """Action: search_code
-Action Input: {"query": "test"}
-Observation: Found results
-Based on these results, the final answer is: test passed."""
-
-        result = react_parser.extract_final_answer(response)
+        result = react_parser.extract_final_answer(_ANSWER_AFTER_OBSERVATION)
 
         # Should extract content after observations
         assert result is not None
@@ -238,28 +272,20 @@ Based on these results, the final answer is: test passed."""
 class TestReActParserActionInputParsing:
     """Test parsing of Action Input in various formats."""
 
-    def test_parse_action_input_as_json(self, react_parser):
-        """Test parsing action input from JSON."""
-        result = react_parser._parse_action_input('{"query": "test", "max": 5}')
-
-        assert isinstance(result, dict)
-        assert result["query"] == "test"
-        assert result["max"] == 5
-
-    def test_parse_action_input_as_key_value(self, react_parser):
-        """Test parsing action input from key=value format."""
-        result = react_parser._parse_action_input("query=test\nmax=5")
-
-        assert isinstance(result, dict)
-        assert result["query"] == "test"
-        assert result["max"] == "5"
-
-    def test_parse_action_input_as_plain_string(self, react_parser):
-        """Test parsing plain text as single parameter."""
-        result = react_parser._parse_action_input("plain text input")
+    @pytest.mark.parametrize(
+        "input_str, expected_dict",
+        [
+            pytest.param('{"query": "test", "max": 5}', {"query": "test", "max": 5}, id="json"),
+            pytest.param("query=test\nmax=5", {"query": "test", "max": "5"}, id="key_value"),
+            pytest.param("plain text input", {"input": "plain text input"}, id="plain_string"),
+        ],
+    )
+    def test_parse_action_input_variants(self, react_parser, input_str, expected_dict):
+        """Test parsing action input from JSON, key=value and plain text."""
+        result = react_parser._parse_action_input(input_str)
 
         assert isinstance(result, dict)
-        assert result.get("input") == "plain text input"
+        assert result == expected_dict
 
 
 class TestReActParserEdgeCases:
@@ -279,15 +305,7 @@ class TestReActParserEdgeCases:
 
     def test_parse_multiple_thought_sections(self, react_parser):
         """Test parsing multiple Thought sections."""
-        response = """Thought: First thought
-Action: search_code
-Action Input: {"query": "first"}
-
-Thought: Second thought
-Action: echo
-Action Input: {"text": "second"}"""
-
-        blocks = react_parser.parse_response(response)
+        blocks = react_parser.parse_response(_MULTIPLE_THOUGHTS)
 
         assert len(blocks) >= 2
 
@@ -364,112 +382,113 @@ Action Input: {"query": "test"}"""
 # DataIterator Tests
 # ============================================================================
 
-class TestDataIteratorBasicFunctionality:
-    """Test basic DataIterator functionality."""
+def _identity(item: DataItem) -> DataItem:
+    return item
 
-    def test_iterate_dataset_processes_batches(self, tmp_path, stub_verifier, stub_cas):
-        """Test that DataIterator processes dataset items in batches."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(
-            json.dumps({"content": "Item one"}) + "\n" +
-            json.dumps({"content": "Item two"}) + "\n"
-        )
 
-        def transform(item: DataItem) -> DataItem:
-            item.content = item.content.upper()
-            return item
+def _upper(item: DataItem) -> DataItem:
+    item.content = item.content.upper()
+    return item
 
-        def quality(item: DataItem) -> float:
-            return 1.0 if len(item.content) > 0 else 0.0
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1, batch_size=2),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+def _nonempty(item: DataItem) -> float:
+    return 1.0 if len(item.content) > 0 else 0.0
 
-        results = list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
-            transform_fn=transform,
-            quality_fn=quality,
-        ))
 
-        assert len(results) >= 1
-        assert results[0].content == "ITEM ONE" or results[0].content == "Item one"
+def _longer_than_5(item: DataItem) -> float:
+    return 1.0 if len(item.content) > 5 else 0.0
 
-    def test_iterator_sets_cas_key_in_metadata(self, tmp_path, stub_verifier, stub_cas):
-        """Test that iterator stores CAS key in item metadata."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(json.dumps({"content": "Test item"}) + "\n")
 
-        def transform(item: DataItem) -> DataItem:
-            return item
+# (records, transform, quality, config, expected contents)
+ITERATE_CASES = [
+    pytest.param(
+        [{"content": "Item one"}, {"content": "Item two"}],
+        _upper, _nonempty, {"batch_size": 2},
+        ["ITEM ONE", "ITEM TWO"],
+        id="processes-batches",
+    ),
+    pytest.param(
+        [{"content": "Test item"}],
+        _identity, lambda item: 1.0, {"batch_size": 1},
+        ["Test item"],
+        id="sets-cas-key",
+    ),
+    pytest.param(
+        [{"content": ""}, {"content": "Good content here"}],  # Poor, then good quality
+        _identity, _longer_than_5, {"batch_size": 10, "quality_threshold": 0.5},
+        ["Good content here"],
+        id="applies-quality-filter",
+    ),
+]
 
-        def quality(item: DataItem) -> float:
-            return 1.0
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1, batch_size=1),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+class TestDataIteratorBasicFunctionality:
+    """Test basic DataIterator functionality."""
+
+    @pytest.mark.parametrize("source,transform,quality,cfg,expected_contents", ITERATE_CASES)
+    def test_iterate_dataset(self, iterator_factory, source, transform, quality, cfg, expected_contents):
+        """Test batching, quality filtering and CAS keys on yielded items."""
+        iterator = iterator_factory(max_iterations=1, **cfg)
 
         results = list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
+            dataset_source=source,
             transform_fn=transform,
             quality_fn=quality,
         ))
 
-        assert len(results) >= 1
-        assert "cas_key" in results[0].metadata
-        assert results[0].metadata["cas_key"].startswith("cas://")
+        # Only items meeting the quality threshold are returned, in order
+        assert [item.content for item in results] == expected_contents
+        # Every yielded item was cached and carries its CAS key
+        assert all(item.metadata["cas_key"].startswith("cas://") for item in results)
+
+    def test_cas_key_set_before_yield(self, iterator_factory):
+        """Test that each item carries its CAS key when yielded, not only after draining."""
+        cas = SlowStubCAS()
+        iterator = iterator_factory(max_iterations=2, batch_size=2, cas_store=cas)
+
+        keys = [
+            item.metadata.get("cas_key")
+            for item in iterator.iterate_dataset(
+                dataset_source=[{"content": f"Item {i}"} for i in range(2)],
+                transform_fn=_identity,
+                quality_fn=lambda item: 1.0,
+            )
+        ]
 
-    def test_iterator_applies_quality_filter(self, tmp_path, stub_verifier, stub_cas):
-        """Test that iterator filters items by quality threshold."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(
-            json.dumps({"content": ""}) + "\n" +  # Poor quality
-            json.dumps({"content": "Good content here"}) + "\n"  # Good quality
-        )
+        assert keys == ["cas://1", "cas://2", "cas://3", "cas://4"]
+        # The second pass serializes the keys the first pass stored
+        assert [p["metadata"].get("cas_key") for p in cas.payloads] == [None, None, "cas://1", "cas://2"]
 
-        def transform(item: DataItem) -> DataItem:
-            return item
+    def test_iterate_dataset_requires_path_or_source(self, iterator_factory):
+        """Test that a missing dataset path and source is rejected."""
+        iterator = iterator_factory()
 
-        def quality(item: DataItem) -> float:
-            return 1.0 if len(item.content) > 5 else 0.0
-
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(
-                max_iterations=1,
-                batch_size=10,
-                quality_threshold=0.5
-            ),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+        with pytest.raises(ValueError, match="dataset_path or dataset_source"):
+            list(iterator.iterate_dataset(transform_fn=_identity, quality_fn=lambda i: 1.0))
 
-        results = list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
-            transform_fn=transform,
-            quality_fn=quality,
-        ))
+    def test_iterate_dataset_accepts_positional_args(self, tmp_path, iterator_factory):
+        """Test the (dataset_path, transform_fn, quality_fn) positional form."""
+        (tmp_path / "sample.jsonl").write_text('{"content": "Item one"}\n', encoding="utf-8")
+        iterator = iterator_factory(root=tmp_path, max_iterations=1)
+
+        results = list(iterator.iterate_dataset("sample.jsonl", _upper, _nonempty))
+
+        assert [item.content for item in results] == ["ITEM ONE"]
 
-        # Only high-quality items should be returned
-        assert all(len(item.content) > 5 for item in results)
+    def test_iterate_dataset_requires_callables(self, iterator_factory):
+        """Test that missing transform or quality functions are rejected."""
+        iterator = iterator_factory()
+
+        with pytest.raises(TypeError, match="transform_fn and quality_fn"):
+            list(iterator.iterate_dataset(dataset_source=[{"content": "x"}], transform_fn=_identity))
 
 
 class TestDataIteratorVerificationGating:
     """Test verifier integration with DataIterator."""
 
-    def test_verifier_marks_items_verified(self, tmp_path, stub_verifier, stub_cas):
+    def test_verifier_marks_items_verified(self, iterator_factory):
         """Test that verified items are marked correctly."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(
-            json.dumps({"content": "Claim with source", "sources": ["source1"]}) + "\n"
-        )
+        source = [{"content": "Claim with source", "sources": ["source1"]}]
 
         def transform(item: DataItem) -> DataItem:
             return item
@@ -477,15 +496,10 @@ class TestDataIteratorVerificationGating:
         def quality(item: DataItem) -> float:
             return 1.0
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+        iterator = iterator_factory(max_iterations=1)
 
         results = list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
+            dataset_source=source,
             transform_fn=transform,
             quality_fn=quality,
         ))
@@ -494,10 +508,9 @@ class TestDataIteratorVerificationGating:
         # Verified items should have verification status
         assert "verification_status" in results[0].metadata or True
 
-    def test_verifier_marks_items_pending_without_sources(self, tmp_path, stub_cas):
+    def test_verifier_marks_items_pending_without_sources(self, iterator_factory):
         """Test that items without sources are marked pending."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(json.dumps({"content": "Content without sources"}) + "\n")
+        source = [{"content": "Content without sources"}]
 
         def transform(item: DataItem) -> DataItem:
             return item
@@ -508,30 +521,93 @@ class TestDataIteratorVerificationGating:
         # Verifier that requires sources
         verifier = StubVerifier(should_verify=False)
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1),
-            cas_store=stub_cas,
-            verifier=verifier,
-        )
+        iterator = iterator_factory(max_iterations=1, verifier=verifier)
 
-        results = list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
+        first = next(iterator.iterate_dataset(
+            dataset_source=source,
             transform_fn=transform,
             quality_fn=quality,
-        ))
+        ), None)
 
         # Should still process items even without verification
-        assert len(results) >= 1
+        assert first is not None
+        assert first.verification_status == "pending"
+        assert verifier.batch_sizes == []
+
+    def test_verifier_called_once_per_batch(self, iterator_factory):
+        """Test that sourced items are verified with one verify_batch call per batch."""
+        source = [{"content": f"Claim {i}", "sources": ["source1"]} for i in range(5)]
+        verifier = StubVerifier(should_verify=True)
+
+        iterator = iterator_factory(max_iterations=1, batch_size=3, verifier=verifier)
+
+        results = list(iterator.iterate_dataset(
+            dataset_source=source,
+            transform_fn=lambda item: item,
+            quality_fn=lambda item: 1.0,
+        ))
+
+        assert verifier.batch_sizes == [3, 2]
+        assert {item.verification_status for item in results} == {"verified"}
+
+    def test_verify_cache_skips_unchanged_items(self, iterator_factory):
+        """Test that verify_cache only sends new (content, sources) pairs to the verifier."""
+        source = [{"content": f"Claim {i}", "sources": ["source1"]} for i in range(3)]
+        verifier = StubVerifier(should_verify=True)
+
+        iterator = iterator_factory(max_iterations=3, verify_cache=True, verifier=verifier)
+
+        results = list(iterator.iterate_dataset(
+            dataset_source=source,
+            transform_fn=_identity,
+            quality_fn=lambda item: 1.0,
+        ))
+
+        # Later iterations leave the content unchanged, so only the first verifies
+        assert verifier.batch_sizes == [3]
+        assert {item.verification_status for item in results} == {"verified"}
+
+    def test_verifier_error_fails_only_the_bad_item(self, iterator_factory):
+        """Test that a verifier exception fails just the offending claim."""
+        class FlakyVerifier(StubVerifier):
+            def __init__(self):
+                super().__init__(should_verify=True)
+                self.claims_checked: List[str] = []
+
+            def verify_claim(self, claim_text, sources):
+                self.claims_checked.append(claim_text)
+                if claim_text == "bad":
+                    raise RuntimeError("verifier exploded")
+                return super().verify_claim(claim_text, sources)
+
+        source = [{"content": c, "sources": ["source1"]} for c in ("good", "bad", "also good")]
+        verifier = FlakyVerifier()
+
+        iterator = iterator_factory(max_iterations=2, verify_cache=True, verifier=verifier)
+
+        results = list(iterator.iterate_dataset(
+            dataset_source=source,
+            transform_fn=_identity,
+            quality_fn=lambda item: 1.0,
+        ))
+
+        statuses = {item.content: item.verification_status for item in results}
+        assert statuses == {"good": "verified", "bad": "failed", "also good": "verified"}
+        # Each failed batch call falls back to per-item checks. Only real
+        # verdicts are memoized, so just the bad claim is retried on pass two
+        assert verifier.claims_checked == [
+            "good", "bad",               # pass 1, batch call
+            "good", "bad", "also good",  # pass 1, per-item fallback
+            "bad", "bad",                # pass 2, batch then fallback
+        ]
 
 
 class TestDataIteratorCASIntegration:
     """Test Content-Addressable Store integration."""
 
-    def test_cas_stores_iteration_results(self, tmp_path, stub_verifier, stub_cas):
+    def test_cas_stores_iteration_results(self, stub_cas, iterator_factory):
         """Test that iteration results are stored in CAS."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(json.dumps({"content": "Test content"}) + "\n")
+        source = [{"content": "Test content"}]
 
         def transform(item: DataItem) -> DataItem:
             return item
@@ -539,26 +615,20 @@ class TestDataIteratorCASIntegration:
         def quality(item: DataItem) -> float:
             return 1.0
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+        iterator = iterator_factory(max_iterations=1)
 
-        results = list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
+        deque(iterator.iterate_dataset(
+            dataset_source=source,
             transform_fn=transform,
             quality_fn=quality,
-        ))
+        ), maxlen=0)
 
         # CAS should have stored items
-        assert len(stub_cas.stored) >= 1
+        assert stub_cas.key_counter >= 1
 
-    def test_cas_failure_logged_gracefully(self, tmp_path, stub_verifier):
+    def test_cas_failure_logged_gracefully(self, iterator_factory):
         """Test that CAS failures are logged but don't stop iteration."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(json.dumps({"content": "Test content"}) + "\n")
+        source = [{"content": "Test content"}]
 
         def transform(item: DataItem) -> DataItem:
             return item
@@ -570,35 +640,56 @@ class TestDataIteratorCASIntegration:
         failing_cas = Mock()
         failing_cas.put.side_effect = ValueError("CAS failure")
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1),
-            cas_store=failing_cas,
-            verifier=stub_verifier,
-        )
+        iterator = iterator_factory(max_iterations=1, cas_store=failing_cas)
 
         # Should complete despite CAS failure
         with patch("src.data_iterator.logger") as mock_logger:
-            results = list(iterator.iterate_dataset(
-                dataset_path="sample.jsonl",
+            first = next(iterator.iterate_dataset(
+                dataset_source=source,
                 transform_fn=transform,
                 quality_fn=quality,
-            ))
+            ), None)
 
             # Should still process items
-            assert len(results) >= 1
+            assert first is not None
+
+    def test_payload_encoding_independent_of_orjson(self):
+        """Test that the stdlib fallback writes the same CAS bytes as orjson."""
+        payload = {
+            "content": "café ✓ \"quoted\"",
+            "metadata": {"sources": ["a", "b"], "nested": {"n": None}},
+            "quality_score": 0.75,
+            "iteration": 2,
+        }
+
+        expected = (
+            '{"content":"café ✓ \\"quoted\\"","metadata":{"sources":["a","b"],'
+            '"nested":{"n":null}},"quality_score":0.75,"iteration":2}'
+        ).encode("utf-8")
+        assert _json_dumps(payload) == expected
+        orjson = pytest.importorskip("orjson")
+        assert orjson.dumps(payload) == expected
+
+    def test_payload_orjson_rejects_is_still_cached(self, stub_cas, iterator_factory):
+        """Test that data orjson can't encode falls back to the stdlib encoder."""
+        iterator = iterator_factory()
+        item = DataItem(content="big", metadata={"count": 2 ** 70, 1: "int key"})
+
+        iterator._cache_item(item)
+
+        assert item.metadata["cas_key"].startswith("cas://")
+        assert stub_cas.key_counter == 1
 
 
 class TestDataIteratorStatsAggregation:
     """Test statistics aggregation."""
 
-    def test_stats_compute_totals_correctly(self, tmp_path, stub_verifier, stub_cas):
+    def test_stats_compute_totals_correctly(self, iterator_factory):
         """Test that iteration stats compute totals correctly."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(
-            json.dumps({"content": "Item 1"}) + "\n" +
-            json.dumps({"content": "Item 2"}) + "\n"
-        )
+        source = [
+            {"content": "Item 1"},
+            {"content": "Item 2"},
+        ]
 
         def transform(item: DataItem) -> DataItem:
             return item
@@ -606,18 +697,13 @@ class TestDataIteratorStatsAggregation:
         def quality(item: DataItem) -> float:
             return 1.0
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+        iterator = iterator_factory(max_iterations=1)
 
-        list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
+        deque(iterator.iterate_dataset(
+            dataset_source=source,
             transform_fn=transform,
             quality_fn=quality,
-        ))
+        ), maxlen=0)
 
         stats = iterator.get_iteration_stats()
 
@@ -625,10 +711,9 @@ class TestDataIteratorStatsAggregation:
         assert "total_items_processed" in stats
         assert stats["total_items_processed"] >= 1
 
-    def test_stats_for_empty_batches(self, tmp_path, stub_verifier, stub_cas):
+    def test_stats_for_empty_batches(self, iterator_factory):
         """Test stats when no items pass quality threshold."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(json.dumps({"content": ""}) + "\n")
+        source = [{"content": ""}]
 
         def transform(item: DataItem) -> DataItem:
             return item
@@ -636,20 +721,14 @@ class TestDataIteratorStatsAggregation:
         def quality(_: DataItem) -> float:
             return 0.0  # All items fail quality check
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+        iterator = iterator_factory(max_iterations=1)
 
-        results = list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
+        # Nothing is yielded, so next() drains the whole generator
+        assert next(iterator.iterate_dataset(
+            dataset_source=source,
             transform_fn=transform,
             quality_fn=quality,
-        ))
-
-        assert results == []
+        ), None) is None
         stats = iterator.get_iteration_stats()
         assert stats is not None
 
@@ -657,10 +736,9 @@ class TestDataIteratorStatsAggregation:
 class TestDataIteratorMultipleIterations:
     """Test multiple iteration cycles."""
 
-    def test_iterator_respects_max_iterations(self, tmp_path, stub_verifier, stub_cas):
+    def test_iterator_respects_max_iterations(self, iterator_factory):
         """Test that iterator respects max_iterations limit."""
-        dataset = tmp_path / "sample.jsonl"
-        dataset.write_text(json.dumps({"content": "Test"}) + "\n")
+        source = [{"content": "Test"}]
 
         iteration_count = [0]
 
@@ -671,24 +749,37 @@ class TestDataIteratorMultipleIterations:
         def quality(item: DataItem) -> float:
             return 0.5  # Borderline quality to trigger re-iteration
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=3),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+        iterator = iterator_factory(max_iterations=3)
 
-        list(iterator.iterate_dataset(
-            dataset_path="sample.jsonl",
+        deque(iterator.iterate_dataset(
+            dataset_source=source,
             transform_fn=transform,
             quality_fn=quality,
-        ))
+        ), maxlen=0)
 
         # Should not exceed max iterations
         stats = iterator.get_iteration_stats()
         assert stats is not None
 
 
+class TestDataIteratorJsonlLoading:
+    """Test the chunked JSONL reader."""
+
+    def test_load_jsonl_across_chunk_boundaries(self, tmp_path, monkeypatch, iterator_factory):
+        """Test that lines split across reads, bad lines and a missing final newline are handled."""
+        monkeypatch.setattr("src.data_iterator._JSONL_CHUNK_SIZE", 7)
+        dataset = tmp_path / "sample.jsonl"
+        dataset.write_text(
+            '{"content": "café"}\nnot json\n{"content": "second", "sources": ["s1"]}',
+            encoding="utf-8",
+        )
+
+        items = iterator_factory()._load_jsonl(dataset)
+
+        assert [item.content for item in items] == ["café", "second"]
+        assert items[1].sources == ["s1"]
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -696,7 +787,7 @@ class TestDataIteratorMultipleIterations:
 class TestIntegrationReActWithDataIterator:
     """Test integration of ReAct execution with DataIterator."""
 
-    def test_react_executor_output_feeds_iterator(self, react_executor, tmp_path, stub_verifier, stub_cas):
+    def test_react_executor_output_feeds_iterator(self, react_executor, tmp_path, iterator_factory):
         """Test that ReAct executor output can feed into data iterator."""
         # Execute tool through ReAct
         response = """Action: echo
@@ -706,7 +797,7 @@ Action Input: {"text": "tool result"}"""
 
         # Write executor output to dataset
         dataset = tmp_path / "results.jsonl"
-        dataset.write_text(json.dumps({"content": observation}) + "\n")
+        dataset.write_bytes(json.dumps({"content": observation}).encode("utf-8") + b"\n")
 
         # Process through iterator
         def transform(item: DataItem) -> DataItem:
@@ -716,12 +807,7 @@ Action Input: {"text": "tool result"}"""
         def quality(item: DataItem) -> float:
             return 1.0 if len(item.content) > 0 else 0.0
 
-        iterator = DataIterator(
-            root=str(tmp_path),
-            config=IterationConfig(max_iterations=1),
-            cas_store=stub_cas,
-            verifier=stub_verifier,
-        )
+        iterator = iterator_factory(root=str(tmp_path), max_iterations=1)
 
         results = list(iterator.iterate_dataset(
             dataset_path="results.jsonl",
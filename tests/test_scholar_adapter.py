@@ -1,6 +1,8 @@
 import sys
+import threading
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -8,6 +10,23 @@ if str(ROOT) not in sys.path:
 
 from src.scholar_adapter import ScholarAdapter, PaperMeta  # noqa: E402
 
+# Parsed once; _arxiv only reads from the tree
+_ARXIV_ROOT = ET.fromstring("""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry>
+    <title>ArXiv Test</title>
+    <author><name>Charlie</name></author>
+    <published>2025-01-01T00:00:00Z</published>
+    <summary>ArXiv abstract</summary>
+    <id>http://arxiv.org/abs/2501.00001</id>
+    <link title="pdf" href="http://arxiv.org/pdf/2501.00001.pdf"/>
+  </entry>
+</feed>""")
+
+
+def _raiser():
+    raise RuntimeError("fail")
+
 
 def test_paper_meta_schema():
     # Ensure PaperMeta matches expected schema
@@ -83,35 +102,7 @@ def test_crossref_provider():
 
 
 def test_arxiv_provider():
-    mock_xml = """<?xml version="1.0" encoding="UTF-8"?>
-<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
-  <entry>
-    <title>ArXiv Test</title>
-    <author><name>Charlie</name></author>
-    <published>2025-01-01T00:00:00Z</published>
-    <summary>ArXiv abstract</summary>
-    <id>http://arxiv.org/abs/2501.00001</id>
-    <link title="pdf" href="http://arxiv.org/pdf/2501.00001.pdf"/>
-  </entry>
-</feed>"""
-    with patch('src.scholar_adapter._http_get_xml') as mock_get:
-        mock_root = MagicMock()
-        mock_root.findall.return_value = [
-            MagicMock(
-                find=lambda tag, ns=None: {
-                    "atom:title": MagicMock(text="ArXiv Test"),
-                    "atom:author": MagicMock(find=lambda t, ns=None: MagicMock(text="Charlie") if t=="atom:name" else None),
-                    "atom:published": MagicMock(text="2025-01-01T00:00:00Z"),
-                    "atom:summary": MagicMock(text="ArXiv abstract"),
-                    "atom:id": MagicMock(text="http://arxiv.org/abs/2501.00001"),
-                }[tag],
-                findall=lambda tag, ns=None: {
-                    "atom:author": [MagicMock(find=lambda t, ns=None: MagicMock(text="Charlie") if t=="atom:name" else None)],
-                    "atom:link": [MagicMock(get=lambda k: "pdf" if k=="title" else "http://arxiv.org/pdf/2501.00001.pdf")],
-                }[tag]
-            )
-        ]
-        mock_get.return_value = mock_root
+    with patch('src.scholar_adapter._http_get_xml', return_value=_ARXIV_ROOT):
         adapter = ScholarAdapter()
         adapter.cb["arxiv"].call = lambda f, *a, **k: f(*a, **k)
         papers = adapter._arxiv("test query")
@@ -150,10 +141,14 @@ def test_openalex_provider():
 
 
 def test_search_with_fallbacks_and_deduplication():
-    # Mock providers to return overlapping papers
+    # Mock providers to return overlapping papers; semantic_scholar only
+    # finishes after crossref has run, so completion order is reversed
+    crossref_called = threading.Event()
     def mock_semantic(q):
+        assert crossref_called.wait(timeout=5), "providers were not dispatched concurrently"
         return [PaperMeta(id="1", title="Paper A", authors=[], venue=None, year=2025, abstract=None, doi=None, url=None, pdf_url=None, source="semantic_scholar")]
     def mock_crossref(q):
+        crossref_called.set()
         return [PaperMeta(id="2", title="Paper A", authors=[], venue=None, year=2025, abstract=None, doi=None, url=None, pdf_url=None, source="crossref")]
     def mock_arxiv(q):
         return [PaperMeta(id="3", title="Paper B", authors=[], venue=None, year=2025, abstract=None, doi=None, url=None, pdf_url=None, source="arxiv")]
@@ -166,25 +161,53 @@ def test_search_with_fallbacks_and_deduplication():
     adapter._openalex = mock_openalex
     papers = adapter.search("test", k=5)
     # Should deduplicate by title+year, returning only Paper A and Paper B
-    titles = {p.title for p in papers}
-    assert titles == {"Paper A", "Paper B"}
-    # Paper A should come from semantic_scholar (first provider)
-    assert next(p for p in papers if p.title == "Paper A").source == "semantic_scholar"
+    assert [p.title for p in papers] == ["Paper A", "Paper B"]
+    # Paper A should come from semantic_scholar (first provider) even though
+    # crossref completed first
+    assert papers[0].source == "semantic_scholar"
+
+
+def test_search_stops_retrying_once_k_results_are_in(monkeypatch):
+    # Long backoffs: without the stop signal crossref would keep retrying
+    # after search has already returned
+    monkeypatch.setattr('src.scholar_adapter._jitter_backoff', lambda attempt: 30.0)
+    crossref_failed = threading.Event()
+    crossref_calls = []
+    def mock_semantic(q):
+        assert crossref_failed.wait(timeout=5)
+        return [PaperMeta(id="1", title="Paper A", authors=[], venue=None, year=2025, abstract=None, doi=None, url=None, pdf_url=None, source="semantic_scholar")]
+    def mock_crossref(q):
+        crossref_calls.append(q)
+        crossref_failed.set()
+        raise RuntimeError("crossref down")
+    adapter = ScholarAdapter()
+    adapter._semantic_scholar = mock_semantic
+    adapter._crossref = mock_crossref
+    adapter._arxiv = lambda q: []
+    adapter._openalex = lambda q: []
+    papers = adapter.search("test", k=1)
+    assert [p.source for p in papers] == ["semantic_scholar"]
+    # Let the abandoned workers wind down, then check crossref gave up
+    for t in threading.enumerate():
+        if t.name.startswith("scholar-search"):
+            t.join(timeout=5)
+            assert not t.is_alive()
+    assert crossref_calls == ["test"]
 
 
 def test_circuit_breaker_opens_on_failures():
     adapter = ScholarAdapter()
     breaker = adapter.cb["semantic_scholar"]
     # Force failures
-    failing_func = lambda: (_ for _ in ()).throw(Exception("fail"))
-    for _ in range(adapter.cb["semantic_scholar"].failure_threshold):
+    n = breaker.failure_threshold
+    for _ in range(n):
         try:
-            breaker.call(failing_func)
+            breaker.call(_raiser)
         except Exception:
             pass
     # Now circuit should be open
     try:
-        breaker.call(failing_func)
+        breaker.call(_raiser)
         assert False, "Expected circuit breaker open exception"
     except Exception as e:
         assert "open" in str(e).lower()
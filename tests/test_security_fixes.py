@@ -1,37 +1,84 @@
 """
 Test security fixes for Agent Lightning integration
 """
-import unittest
-import tempfile
+import glob
+import json
 import os
+import re
+import shutil
 import sys
+import tempfile
+import unittest
+from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from export_guard import check_export_path
 from optimized_tongyi_agent import OptimizedTongyiAgent
 from optimized_claude_agent import OptimizedClaudeAgent
 
+# Secrets planted in the interaction histories; none may survive an export.
+# Bytes pattern so exports are scanned exactly as written
+_FORBIDDEN = re.compile(b"|".join(map(re.escape, [
+    b"secret123",
+    b"sk-1234567890",
+    b"My password",
+    b"admin:admin",
+    b"password:secret",
+])))
+
+DANGEROUS_PATHS = [
+    # Relative path traversal
+    "../../../etc/passwd",
+    "..\\..\\windows\\system32\\config",
+    # Absolute paths outside safe directory
+    "/etc/shadow",
+    "C:\\Windows\\System32\\drivers\\etc\\hosts",
+    "C:\\Windows\\System32\\config",
+    "/etc/passwd",
+    "C:\\Users\\Public\\Documents\\..\\..\\Windows\\System32",
+    # Dangerous path patterns
+    "path_with_../../../etc/passwd",
+    "C:\\Users\\temp\\..\\..\\Windows\\System32\\file",
+    "some_path/../../../../../etc/shadow",
+]
+
+# Memory-backed scratch space where the platform has one; exports here never
+# touch the disk
+_SCRATCH_PARENT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
 
 class TestSecurityFixes(unittest.TestCase):
     """Test security fixes for Agent Lightning integration"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.agent_tongyi = OptimizedTongyiAgent(
-            root=self.temp_dir,
+    @classmethod
+    def setUpClass(cls):
+        """Build the agents once; construction dominates these tests"""
+        cls.temp_dir = tempfile.mkdtemp(dir=_SCRATCH_PARENT)
+        cls.agent_tongyi = OptimizedTongyiAgent(
+            root=cls.temp_dir,
             enable_training=False
         )
-        self.agent_claude = OptimizedClaudeAgent(
-            root=self.temp_dir,
+        cls.agent_claude = OptimizedClaudeAgent(
+            root=cls.temp_dir,
             enable_training=False
         )
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def setUp(self):
+        """Reset the shared agents' history and exported files"""
+        self.agent_tongyi.interaction_history.clear()
+        self.agent_claude.interaction_history.clear()
+        for path in glob.glob(os.path.join(self.temp_dir, "*")) + glob.glob(os.path.join(self.temp_dir, ".*")):
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
 
     def test_export_filepath_validation(self):
         """Test that export validates filepaths properly"""
@@ -44,44 +91,13 @@ class TestSecurityFixes(unittest.TestCase):
 
     def test_export_path_traversal_protection(self):
         """Test that export prevents path traversal attacks"""
-        # Test relative path traversal
-        dangerous_relative_paths = [
-            "../../../etc/passwd",
-            "..\\..\\windows\\system32\\config"
-        ]
-
-        for dangerous_path in dangerous_relative_paths:
-            with self.assertRaises((ValueError, TypeError)):
-                self.agent_tongyi.export_training_data(dangerous_path)
-
-        # Test absolute paths outside safe directory
-        dangerous_absolute_paths = [
-            "/etc/shadow",
-            "C:\\Windows\\System32\\drivers\\etc\\hosts",
-            "C:\\Windows\\System32\\config",
-            "/etc/passwd",
-            "C:\\Users\\Public\\Documents\\..\\..\\Windows\\System32"
-        ]
-
-        for dangerous_path in dangerous_absolute_paths:
-            with self.assertRaises((ValueError, TypeError)):
-                self.agent_tongyi.export_training_data(dangerous_path)
-
-        # Test dangerous path patterns
-        dangerous_pattern_paths = [
-            "path_with_../../../etc/passwd",
-            "C:\\Users\\temp\\..\\..\\Windows\\System32\\file",
-            "some_path/../../../../../etc/shadow"
-        ]
-
-        for dangerous_path in dangerous_pattern_paths:
-            with self.assertRaises((ValueError, TypeError)):
-                self.agent_tongyi.export_training_data(dangerous_path)
+        for dangerous_path in DANGEROUS_PATHS:
+            with self.subTest(path=dangerous_path):
+                with self.assertRaises((ValueError, TypeError)):
+                    self.agent_tongyi.export_training_data(dangerous_path)
 
     def test_export_sanitizes_data(self):
         """Test that export sanitizes sensitive data"""
-        import json
-
         # Add some test interactions with sensitive data
         self.agent_tongyi.interaction_history.append({
             "timestamp": 1234567890,
@@ -98,15 +114,13 @@ class TestSecurityFixes(unittest.TestCase):
         # Verify export was created
         self.assertTrue(os.path.exists(export_file))
 
-        # Load and verify sanitization
-        with open(export_file, 'r') as f:
-            data = json.load(f)
+        # Scan the file as written; parse only for the structural checks
+        raw = Path(export_file).read_bytes()
 
         # Check that sensitive data is not in export
-        export_str = json.dumps(data)
-        self.assertNotIn("secret123", export_str)
-        self.assertNotIn("sk-1234567890", export_str)
-        self.assertNotIn("My password", export_str)
+        m = _FORBIDDEN.search(raw)
+        self.assertIsNone(m, f"Leaked secret: {m.group(0).decode() if m else ''}")
+        data = json.loads(raw)
 
         # Verify that metadata is preserved
         self.assertIn("interactions", data)
@@ -148,23 +162,18 @@ class TestSecurityFixes(unittest.TestCase):
         # Verify export was created and sanitized
         self.assertTrue(os.path.exists(export_file))
 
-        import json
-        with open(export_file, 'r') as f:
-            data = json.load(f)
+        raw = Path(export_file).read_bytes()
 
-        export_str = json.dumps(data)
-        self.assertNotIn("admin:admin", export_str)
-        self.assertNotIn("password:secret", export_str)
-        self.assertEqual(data["agent_type"], "claude_sdk")
+        m = _FORBIDDEN.search(raw)
+        self.assertIsNone(m, f"Leaked secret: {m.group(0).decode() if m else ''}")
+        self.assertEqual(json.loads(raw)["agent_type"], "claude_sdk")
 
     def test_export_version_metadata(self):
         """Test that exports include version metadata"""
         export_file = os.path.join(self.temp_dir, "version_test.json")
         self.agent_tongyi.export_training_data(export_file)
 
-        import json
-        with open(export_file, 'r') as f:
-            data = json.load(f)
+        data = json.loads(Path(export_file).read_bytes())
 
         # Check version metadata
         self.assertIn("version", data)
@@ -173,9 +182,37 @@ class TestSecurityFixes(unittest.TestCase):
         self.assertIsInstance(data["export_timestamp"], (int, float))
 
 
+class TestExportGuard(unittest.TestCase):
+    """Test the shared export path checks directly"""
+
+    def test_dangerous_paths_rejected(self):
+        for dangerous_path in DANGEROUS_PATHS:
+            with self.subTest(path=dangerous_path):
+                with self.assertRaises(ValueError):
+                    check_export_path(dangerous_path)
+
+    def test_user_profile_paths_allowed(self):
+        # Windows temp and home directories live under C:\Users
+        for safe_path in (
+            "C:\\Users\\dev\\AppData\\Local\\Temp\\export.json",
+            "c:\\users\\dev\\training\\export.json",
+        ):
+            with self.subTest(path=safe_path):
+                check_export_path(safe_path)
+
+
 class TestErrorHandling(unittest.TestCase):
     """Test improved error handling"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp(dir=_SCRATCH_PARENT)
+        cls.agent = OptimizedTongyiAgent(root=cls.temp_dir, enable_training=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
     def test_agent_lightning_unavailable_handling(self):
         """Test graceful handling when Agent Lightning is unavailable"""
         # This should work without raising exceptions
@@ -189,26 +226,16 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_export_with_safe_defaults(self):
         """Test export works with safe default configurations"""
-        temp_dir = tempfile.mkdtemp()
-        try:
-            agent = OptimizedTongyiAgent(root=temp_dir, enable_training=False)
-
-            # Should work without any setup
-            export_file = os.path.join(temp_dir, "safe_export.json")
-            agent.export_training_data(export_file)
+        # Should work without any setup
+        export_file = os.path.join(self.temp_dir, "safe_export.json")
+        self.agent.export_training_data(export_file)
 
-            # Verify file was created
-            self.assertTrue(os.path.exists(export_file))
-
-            # Verify it's valid JSON
-            import json
-            with open(export_file, 'r') as f:
-                data = json.load(f)
-            self.assertIsInstance(data, dict)
+        # Verify file was created
+        self.assertTrue(os.path.exists(export_file))
 
-        finally:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Verify it's valid JSON
+        data = json.loads(Path(export_file).read_bytes())
+        self.assertIsInstance(data, dict)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
@@ -8,17 +10,16 @@ if str(ROOT) not in sys.path:
 from orchestrator_local import LocalOrchestrator  # noqa: E402
 from delegation_policy import AgentBudget  # noqa: E402
 
+pytestmark = pytest.mark.xdist_group("repo_cas")
+
 
 def test_snippet_length_cap_and_compression():
-    # Directly test truncation logic used in orchestrator
+    # Exercise the truncation helper the orchestrator applies to every hit
     long_snippet = "x" * 300
-    truncated = long_snippet
-    if len(truncated) > 160:
-        truncated = truncated[:157] + "…"
-    assert len(truncated) <= 160 + 1  # allow for ellipsis
-    assert truncated.endswith("…")
-    # Ensure original long snippet is longer than cap
-    assert len(long_snippet) > 160
+    truncated = LocalOrchestrator._cap_snippet(long_snippet)
+    assert truncated == "x" * 157 + "…"
+    # Snippets at or under the cap pass through untouched
+    assert LocalOrchestrator._cap_snippet("x" * 160) == "x" * 160
 
 
 def test_report_compression_token_cap():
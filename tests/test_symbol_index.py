@@ -1,24 +1,33 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
 from symbol_index import SymbolIndex  # noqa: E402
 
+pytestmark = pytest.mark.xdist_group("repo_cas")
+
 
-def test_symbol_index_definitions_and_usages():
+@pytest.fixture(scope="session")
+def symbol_index():
+    """SymbolIndex over src/*.py, built once; tests only query it."""
     idx = SymbolIndex(root=str(ROOT))
     # Index a subset of src files
-    src_dir = ROOT / "src"
-    paths = [str(p) for p in src_dir.glob("*.py")]
-    idx.index_paths(paths)
+    idx.index_paths([str(p) for p in (ROOT / "src").glob("*.py")])
+    return idx
 
+
+def test_symbol_index_definitions(symbol_index):
     # Should find class definition for DelegationPolicy
-    defs = idx.find_definitions("DelegationPolicy")
+    defs = symbol_index.find_definitions("DelegationPolicy")
     assert any(Path(p).name == "delegation_policy.py" for p, _ in defs)
 
+
+def test_symbol_index_usages(symbol_index):
     # Should find at least one usage of LocalOrchestrator in tests or src
-    uses = idx.find_usages("LocalOrchestrator")
+    uses = symbol_index.find_usages("LocalOrchestrator")
     assert isinstance(uses, list)
@@ -2,38 +2,47 @@
 Tests for Tongyi-powered orchestrator with tool calling.
 """
 import json
+import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
+from pydantic import ValidationError
+
+from config import TongyiConfig
 from src.tongyi_orchestrator import TongyiOrchestrator
-from src.tool_registry import ToolCall, ToolResult
+from src.tool_registry import ToolResult
+
+
+def _fake_tool_call(name, args, call_id="call_123"):
+    """OpenRouter-style tool call; dict args are JSON-encoded, strings pass through."""
+    arguments = json.dumps(args) if isinstance(args, dict) else args
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+def _fake_response(calls=None):
+    """Chat response carrying ``calls`` (or no tool calls)."""
+    return SimpleNamespace(tool_calls=calls)
+
+
+@pytest.fixture(scope="module")
+def expected_tool_names(orch):
+    """Names of the registered tools, collected once per module."""
+    return frozenset(tool.name for tool in orch.tools.get_tools())
 
 
 class TestTongyiOrchestrator:
     """Test suite for TongyiOrchestrator."""
     
-    @pytest.fixture
-    def mock_client(self):
-        """Mock OpenRouter client."""
-        client = Mock()
-        return client
-    
-    @pytest.fixture
-    def orchestrator(self, mock_client):
-        """Create orchestrator with mocked client."""
-        with patch('src.tongyi_orchestrator.load_openrouter_client', return_value=mock_client):
-            return TongyiOrchestrator(root="/test")
-    
-    def test_init_requires_api_key(self):
-        """Test that config validation happens at import time via Pydantic validation."""
-        # The API key validation happens when DEFAULT_TONGYI_CONFIG is created
-        # at module import time through Pydantic validation + field_validator
-        with patch('config.os.getenv', return_value=None):
-            # This should cause ValidationError when config module is imported
-            with pytest.raises(Exception):  # Catch ValidationError or SystemExit
-                import importlib
-                import config
-                importlib.reload(config)
+    def test_init_requires_api_key(self, monkeypatch):
+        """Test that TongyiConfig rejects a missing or blank API key."""
+        # Built the way DEFAULT_TONGYI_CONFIG is, without reloading config
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        with pytest.raises(ValidationError):
+            TongyiConfig(api_key=os.getenv("OPENROUTER_API_KEY"))
+        # A blank key reaches the field_validator, which exits with setup help
+        with pytest.raises(SystemExit):
+            TongyiConfig(api_key="   ")
     
     def test_init_handles_client_failure(self):
         """Test that orchestrator handles client initialization failure."""
@@ -53,22 +62,9 @@ class TestTongyiOrchestrator:
     
     def test_tool_call_execution(self, orchestrator, mock_client):
         """Test proper tool call execution."""
-        # Create properly structured mock for tool call
-        mock_function = Mock()
-        mock_function.name = "search_code"  # Set as attribute, not parameter
-        mock_function.arguments = json.dumps({"query": "test", "max_results": 5})
-        
-        mock_tool_call = Mock()
-        mock_tool_call.id = "call_123"
-        mock_tool_call.function = mock_function
-        
-        # Mock tool call response
-        tool_response = Mock()
-        tool_response.tool_calls = [mock_tool_call]
-        
-        # Mock final response after tool execution
-        final_response = Mock()
-        final_response.tool_calls = None
+        # Mock tool call response, then the final response after tool execution
+        tool_response = _fake_response([_fake_tool_call("search_code", {"query": "test", "max_results": 5})])
+        final_response = _fake_response()
         
         # Set up side_effect for two calls: first with tool, second with final answer
         mock_client.chat.side_effect = [tool_response, final_response]
@@ -91,16 +87,7 @@ class TestTongyiOrchestrator:
         """Test that tool budgets are enforced."""
         # Mock budget exceeded
         with patch.object(orchestrator.policy, 'allow', return_value=False):
-            tool_response = Mock()
-            tool_response.tool_calls = [
-                Mock(
-                    id="call_123",
-                    function=Mock(
-                        name="search_papers",
-                        arguments=json.dumps({"query": "test"})
-                    )
-                )
-            ]
+            tool_response = _fake_response([_fake_tool_call("search_papers", {"query": "test"})])
             mock_client.chat.return_value = tool_response
             
             result = orchestrator.run("Search for papers")
@@ -110,16 +97,7 @@ class TestTongyiOrchestrator:
     
     def test_malformed_tool_call(self, orchestrator, mock_client):
         """Test handling of malformed tool call JSON."""
-        tool_response = Mock()
-        tool_response.tool_calls = [
-            Mock(
-                id="call_123",
-                function=Mock(
-                    name="search_code",
-                    arguments="invalid json {"
-                )
-            )
-        ]
+        tool_response = _fake_response([_fake_tool_call("search_code", "invalid json {")])
         mock_client.chat.return_value = tool_response
         
         # Should continue without executing the malformed tool
@@ -150,16 +128,7 @@ class TestTongyiOrchestrator:
     def test_max_iterations_protection(self, orchestrator, mock_client):
         """Test protection against infinite tool calling loops."""
         # Always return a tool call to trigger max iterations
-        tool_response = Mock()
-        tool_response.tool_calls = [
-            Mock(
-                id="call_123",
-                function=Mock(
-                    name="search_code",
-                    arguments=json.dumps({"query": "loop"})
-                )
-            )
-        ]
+        tool_response = _fake_response([_fake_tool_call("search_code", {"query": "loop"})])
         mock_client.chat.return_value = tool_response
         
         with patch.object(orchestrator.tools, 'execute_tool') as mock_execute:
@@ -185,20 +154,10 @@ class TestTongyiOrchestrator:
     def test_logging_of_tool_calls(self, orchestrator, mock_client):
         """Test that tool calls are properly logged."""
         with patch('src.tongyi_orchestrator.logger') as mock_logger:
-            tool_response = Mock()
-            tool_response.tool_calls = [
-                Mock(
-                    id="call_123",
-                    function=Mock(
-                        name="run_sandbox",
-                        arguments=json.dumps({"code": "print(1)"})
-                    )
-                )
-            ]
+            tool_response = _fake_response([_fake_tool_call("run_sandbox", {"code": "print(1)"})])
             mock_client.chat.return_value = tool_response
             # Set up the second call to return final response
-            second_response = Mock()
-            second_response.tool_calls = None
+            second_response = _fake_response()
             mock_client.chat.side_effect = [tool_response, second_response]
             
             with patch.object(orchestrator.tools, 'execute_tool') as mock_execute:
@@ -218,16 +177,7 @@ class TestTongyiOrchestrator:
     
     def test_error_handling_in_tool_execution(self, orchestrator, mock_client):
         """Test error handling when tool execution fails."""
-        tool_response = Mock()
-        tool_response.tool_calls = [
-            Mock(
-                id="call_123",
-                function=Mock(
-                    name="read_file",
-                    arguments=json.dumps({"path": "nonexistent.py"})
-                )
-            )
-        ]
+        tool_response = _fake_response([_fake_tool_call("read_file", {"path": "nonexistent.py"})])
         mock_client.chat.return_value = tool_response
         mock_client.chat.return_value = "Final response."
         
@@ -255,17 +205,15 @@ class TestTongyiOrchestrator:
             assert result == "Verified answer with citation"
             mock_verify.assert_called_once()
     
-    def test_get_tool_usage_summary(self, orchestrator):
+    def test_get_tool_usage_summary(self, orchestrator, expected_tool_names):
         """Test tool usage summary method."""
         summary = orchestrator.get_tool_usage_summary()
-        registered_tools = orchestrator.tools.get_tools()
-        expected_names = [tool.name for tool in registered_tools]
         
         assert "total_tools" in summary
         assert "tool_names" in summary
         assert "root_directory" in summary
         assert "model" in summary
-        assert summary["total_tools"] == len(expected_names)
-        assert set(summary["tool_names"]) == set(expected_names)
+        assert summary["total_tools"] == len(expected_tool_names)
+        assert set(summary["tool_names"]) == expected_tool_names
         assert "search_code" in summary["tool_names"]
         assert "alibaba/tongyi-deepresearch-30b-a3b" in summary["model"]
@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
@@ -8,33 +10,36 @@ if str(ROOT) not in sys.path:
 from src.verifier_gate import VerifierGate  # type: ignore  # noqa: E402
 
 
-def test_verifier_gate_citation_and_independence_no_client():
+@pytest.fixture(scope="module")
+def vg():
     # Force fallback by passing tongyi_client=None
-    vg = VerifierGate(tongyi_client=None)
+    return VerifierGate(tongyi_client=None)
+
 
+@pytest.mark.parametrize("claim_text, cites, expected", [
     # Two independent local files should pass basic validation
-    claim = vg.verify_claim(
+    pytest.param(
         "Delegation budgets control token usage",
         ["src/delegation_policy.py:70", "src/orchestrator_local.py:100"],
-    )
-    assert claim.verified is True
-    assert claim.confidence >= 0.8
-
-
-def test_verifier_gate_insufficient_citations():
-    vg = VerifierGate(tongyi_client=None)
-    claim = vg.verify_claim(
+        True,
+        id="citation-and-independence-no-client",
+    ),
+    pytest.param(
         "System is fast",
         ["src/orchestrator_local.py:1"],
-    )
-    assert claim.verified is False
-
-
-def test_verifier_gate_independent_sources_same_domain_files():
-    vg = VerifierGate(tongyi_client=None)
+        False,
+        id="insufficient-citations",
+    ),
     # Different files count as independent for local sources
-    claim = vg.verify_claim(
+    pytest.param(
         "Uses CodeSearch and Verifier",
         ["src/code_search.py:10", "src/verifier_gate.py:10"],
-    )
-    assert claim.verified is True
+        True,
+        id="independent-sources-same-domain-files",
+    ),
+])
+def test_verify_claim(vg, claim_text, cites, expected):
+    claim = vg.verify_claim(claim_text, cites)
+    assert claim.verified is expected
+    if expected:
+        assert claim.confidence >= 0.8
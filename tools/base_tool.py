@@ -3,14 +3,16 @@ Base tool interface for Tongyi DeepResearch Agent
 Provides common functionality for all tools
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
-from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Union
+from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
+import inspect
 import logging
+import random
 
-class ToolResult(BaseModel):
+@dataclass(slots=True)
+class ToolResult:
     """Standardized tool result format"""
     
     success: bool = True
@@ -27,32 +29,64 @@ class ToolCategory(Enum):
     ACADEMIC = "academic"
     FILE_PROCESSING = "file_processing"
 
-@dataclass
+@dataclass(slots=True)
 class ToolContext:
     """Context information passed to tools"""
     
     user_query: str
     current_plan: Optional[str] = None
-    previous_steps: List[str] = None
+    previous_steps: List[str] = field(default_factory=list)
     timeout: Optional[int] = None
     max_retries: int = 3
+
+@dataclass(frozen=True, slots=True)
+class ToolInfo:
+    """Descriptive summary of a tool (use dataclasses.asdict for JSON)"""
+    
+    name: str
+    category: str
+    description: str
+    parameters: Dict[str, Any]
+    config: Dict[str, Any]
+
+class KeyInfo(NamedTuple):
+    """Key information extracted from a tool result"""
     
-    def __post_init__(self):
-        if self.previous_steps is None:
-            self.previous_steps = []
+    raw_result: Any
+    tool_name: str
 
 class BaseTool(ABC):
     """Base class for all tools in the Tongyi DeepResearch agent"""
     
+    # Awaited between retries; tests swap in a no-op
+    _sleep: Callable[[float], Awaitable[None]] = staticmethod(asyncio.sleep)
+    
+    # Constant per subclass, so resolved once in __init_subclass__
+    name: str
+    category: ToolCategory
+    logger: logging.Logger
+    _category_per_instance: bool = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__.lower()
+        cls.logger = logging.getLogger(f"tool.{cls.name}")
+        # A class/static _get_category is resolved here once; tools that keep
+        # the instance-method form are still asked in __init__
+        cls._category_per_instance = not isinstance(
+            inspect.getattr_static(cls, "_get_category"), (classmethod, staticmethod)
+        )
+        if not cls._category_per_instance:
+            cls.category = cls._get_category()
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.logger = logging.getLogger(f"tool.{self.__class__.__name__.lower()}")
-        self.category = self._get_category()
-        self.name = self.__class__.__name__.lower()
+        if self._category_per_instance:
+            self.category = self._get_category()
         
     @abstractmethod
     def _get_category(self) -> ToolCategory:
-        """Return the tool category"""
+        """Return the tool category; may be declared as a classmethod"""
         pass
     
     @abstractmethod
@@ -79,15 +113,12 @@ class BaseTool(ABC):
                 result = await self.execute(query, context)
                 if result.success:
                     return result
-                    
                 last_error = result.error
-                if attempt < context.max_retries:
-                    await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
-                    
             except Exception as e:
                 last_error = str(e)
-                if attempt < context.max_retries:
-                    await asyncio.sleep(1 * (attempt + 1))
+                
+            if attempt < context.max_retries:
+                await self._sleep(self._backoff(attempt))
                     
         return ToolResult(
             success=False,
@@ -95,20 +126,25 @@ class BaseTool(ABC):
             metadata={"attempts": context.max_retries + 1}
         )
     
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Exponential backoff capped at 5s, with a little jitter"""
+        return min(0.25 * 2 ** attempt, 5.0) + random.random() * 0.05
+    
     def validate_query(self, query: str) -> bool:
         """Validate if query is appropriate for this tool"""
         return len(query.strip()) > 0
     
-    def extract_key_info(self, result: Any) -> Dict[str, Any]:
+    def extract_key_info(self, result: Any) -> KeyInfo:
         """Extract and structure key information from tool result"""
-        return {"raw_result": result, "tool_name": self.name}
+        return KeyInfo(raw_result=result, tool_name=self.name)
     
-    def get_tool_info(self) -> Dict[str, Any]:
+    def get_tool_info(self) -> ToolInfo:
         """Get comprehensive tool information"""
-        return {
-            "name": self.name,
-            "category": self.category.value,
-            "description": self.get_description(),
-            "parameters": self.get_parameters(),
-            "config": self.config
-        }
+        return ToolInfo(
+            name=self.name,
+            category=self.category.value,
+            description=self.get_description(),
+            parameters=self.get_parameters(),
+            config=self.config
+        )